@@ -11,6 +11,13 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from backend.synth_client import SynthClient
 
 # Percentile levels returned by the Synth API, in ascending order.
@@ -22,6 +29,61 @@ PERCENTILE_KEYS: list[str] = ["0.005", "0.05", "0.2", "0.35", "0.5", "0.65", "0.
 # Horizon durations in seconds.
 _HORIZON_SECONDS: dict[str, int] = {"1h": 3600, "24h": 86400}
 
+# Output-field name per percentile level for cone points.
+_CONE_FIELDS: tuple[tuple[str, float], ...] = (
+    ("p005", 0.005),
+    ("p05", 0.05),
+    ("p20", 0.2),
+    ("p35", 0.35),
+    ("p50", 0.5),
+    ("p65", 0.65),
+    ("p80", 0.8),
+    ("p95", 0.95),
+    ("p995", 0.995),
+)
+
+
+def _cdf_from_sorted(prices: np.ndarray, cdfs: np.ndarray, target: float) -> float:
+    """CDF at *target* given price-sorted percentile arrays.
+
+    Linear interpolation between bracketing levels; linear extrapolation
+    clamped to [0.001, 0.999] beyond the outermost levels. Written as a
+    plain scalar loop so numba can compile it (see below).
+    """
+    n = prices.shape[0]
+
+    if target <= prices[0]:
+        if prices[1] != prices[0]:
+            slope = (cdfs[1] - cdfs[0]) / (prices[1] - prices[0])
+        else:
+            slope = 0.0
+        extrap = cdfs[0] + slope * (target - prices[0])
+        return max(0.001, min(extrap, cdfs[0]))
+
+    if target >= prices[n - 1]:
+        if prices[n - 1] != prices[n - 2]:
+            slope = (cdfs[n - 1] - cdfs[n - 2]) / (prices[n - 1] - prices[n - 2])
+        else:
+            slope = 0.0
+        extrap = cdfs[n - 1] + slope * (target - prices[n - 1])
+        return max(cdfs[n - 1], min(extrap, 0.999))
+
+    for i in range(n - 1):
+        if prices[i] <= target <= prices[i + 1]:
+            span = prices[i + 1] - prices[i]
+            if span == 0:
+                return (cdfs[i] + cdfs[i + 1]) / 2
+            t = (target - prices[i]) / span
+            return cdfs[i] + t * (cdfs[i + 1] - cdfs[i])
+
+    return 0.5
+
+
+if njit is not None:
+    # One-time compile (cached on disk); removes interpreter overhead from
+    # the per-query interpolation loop.
+    _cdf_from_sorted = njit(cache=True, fastmath=True)(_cdf_from_sorted)
+
 
 class ProbabilityEngine:
     """Interpolates Synth percentile forecasts to compute probabilities
@@ -128,6 +190,45 @@ class ProbabilityEngine:
             "confidence": confidence,
         }
 
+    def probability_below_batch(
+        self,
+        asset: str,
+        target_prices: list[float],
+        horizon: str = "24h",
+        timepoint_index: int = -1,
+    ) -> list[float]:
+        """CDF values for several target prices at one timepoint.
+
+        Fetches percentile data once and evaluates all targets against the
+        same sorted percentile pairs via a batched np.interp, instead of one
+        fetch-and-interpolate round trip per price. Targets outside the
+        known percentile range, or equal to a duplicated percentile price
+        (where np.interp and the scalar kernel break ties differently), fall
+        back to the scalar path so results match probability_below exactly.
+        """
+        data = self.get_percentile_data(asset, horizon)
+        percentile_prices = data["timepoints"][timepoint_index]["prices"]
+
+        pairs = sorted(
+            ((percentile_prices[level], level) for level in PERCENTILE_LEVELS),
+            key=lambda x: x[0],
+        )
+        price_arr = np.asarray([p for p, _ in pairs], dtype=np.float64)
+        cdf_arr = np.asarray([c for _, c in pairs], dtype=np.float64)
+        # Adjacent equal prices happen when the forecast is flat (early
+        # timepoints); targets hitting one of those exact prices are ties.
+        tied = set(price_arr[1:][price_arr[1:] == price_arr[:-1]].tolist())
+
+        targets = np.asarray(target_prices, dtype=np.float64)
+        cdfs = np.interp(targets, price_arr, cdf_arr)
+
+        results: list[float] = []
+        for target, cdf in zip(targets.tolist(), cdfs.tolist()):
+            if target <= price_arr[0] or target >= price_arr[-1] or target in tied:
+                cdf = self._interpolate_probability(target, percentile_prices)
+            results.append(round(cdf, 4))
+        return results
+
     def probability_between(
         self,
         asset: str,
@@ -185,28 +286,26 @@ class ProbabilityEngine:
         all_tp = data["timepoints"]
         n = len(all_tp)
 
-        # Pick evenly-spaced indices (always include first and last).
+        # Pick evenly-spaced indices (always include first and last) with
+        # one vectorized linspace+round; np.rint matches round()'s
+        # half-to-even behaviour, so the sampled indices are unchanged.
         if num_points >= n:
             indices = list(range(n))
         else:
-            indices = [round(i * (n - 1) / (num_points - 1)) for i in range(num_points)]
+            indices = np.rint(np.linspace(0, n - 1, num_points)).astype(np.int64).tolist()
 
         points: list[dict[str, Any]] = []
         for idx in indices:
             tp = all_tp[idx]
-            points.append({
-                "seconds_ahead": tp["seconds_ahead"],
-                "hours_ahead": round(tp["seconds_ahead"] / 3600, 3),
-                "p005": tp["prices"][0.005],
-                "p05": tp["prices"][0.05],
-                "p20": tp["prices"][0.2],
-                "p35": tp["prices"][0.35],
-                "p50": tp["prices"][0.5],
-                "p65": tp["prices"][0.65],
-                "p80": tp["prices"][0.8],
-                "p95": tp["prices"][0.95],
-                "p995": tp["prices"][0.995],
-            })
+            seconds = tp["seconds_ahead"]
+            prices = tp["prices"]
+            point: dict[str, Any] = {
+                "seconds_ahead": seconds,
+                "hours_ahead": round(seconds / 3600, 3),
+            }
+            for name, level in _CONE_FIELDS:
+                point[name] = prices[level]
+            points.append(point)
 
         return {
             "asset": asset,
@@ -235,38 +334,15 @@ class ProbabilityEngine:
         we linearly extrapolate from the two nearest levels, clamped to
         [0.001, 0.999] to avoid asserting certainty.
         """
-        # Build sorted list of (price, cdf_level) pairs.
+        # Build price-sorted arrays and hand off to the (optionally
+        # JIT-compiled) scalar kernel.
         pairs = sorted(
             ((percentile_prices[level], level) for level in PERCENTILE_LEVELS),
             key=lambda x: x[0],
         )
-
-        prices = [p for p, _ in pairs]
-        cdfs = [c for _, c in pairs]
-
-        # Below the lowest known percentile — extrapolate.
-        if target_price <= prices[0]:
-            slope = (cdfs[1] - cdfs[0]) / (prices[1] - prices[0]) if prices[1] != prices[0] else 0.0
-            extrap = cdfs[0] + slope * (target_price - prices[0])
-            return max(0.001, min(extrap, cdfs[0]))
-
-        # Above the highest known percentile — extrapolate.
-        if target_price >= prices[-1]:
-            slope = (cdfs[-1] - cdfs[-2]) / (prices[-1] - prices[-2]) if prices[-1] != prices[-2] else 0.0
-            extrap = cdfs[-1] + slope * (target_price - prices[-1])
-            return max(cdfs[-1], min(extrap, 0.999))
-
-        # Find the bracketing pair and interpolate.
-        for i in range(len(prices) - 1):
-            if prices[i] <= target_price <= prices[i + 1]:
-                span = prices[i + 1] - prices[i]
-                if span == 0:
-                    return (cdfs[i] + cdfs[i + 1]) / 2
-                t = (target_price - prices[i]) / span
-                return cdfs[i] + t * (cdfs[i + 1] - cdfs[i])
-
-        # Fallback (should never reach here).
-        return 0.5
+        prices = np.asarray([p for p, _ in pairs], dtype=np.float64)
+        cdfs = np.asarray([c for _, c in pairs], dtype=np.float64)
+        return float(_cdf_from_sorted(prices, cdfs, target_price))
 
     # ------------------------------------------------------------------
     # Helpers
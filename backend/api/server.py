@@ -18,8 +18,8 @@ from pydantic import BaseModel, field_validator
 
 from backend.analysis.position_risk import PositionRiskAnalyzer
 from backend.analysis.probability import ProbabilityEngine
-from backend.config import ASSETS, PERCENTILES_1H_ASSETS, SYNTH_API_KEY
-from backend.synth_client import SynthAPIError, SynthClient
+from backend.config import ASSETS, PERCENTILES_1H_ASSETS
+from backend.synth_client import SynthAPIError, SynthClient, get_client
 
 logger = logging.getLogger("prism.api")
 
@@ -187,7 +187,7 @@ _ASSETS_CACHE_TTL = 60  # seconds
 def _init_engine() -> ProbabilityEngine:
     global _engine
     if _engine is None:
-        raw_client = SynthClient(SYNTH_API_KEY)
+        raw_client = get_client()
         caching_client = _CachingSynthClient(raw_client, ttl=900)
         _engine = ProbabilityEngine(caching_client)  # type: ignore[arg-type]
     return _engine
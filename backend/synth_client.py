@@ -1,12 +1,26 @@
+import asyncio
+import atexit
 import logging
+import threading
 import time
-from typing import Any
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Final
+from urllib.parse import urlencode
 
 import httpx
+import ijson
+import orjson
+from httpx_retries import Retry, RetryTransport
 
 from backend.config import (
+    ASSETS,
     DEFAULT_DAYS,
     DEFAULT_MINER_LIMIT,
+    POLYMARKET_DAILY_ASSETS,
+    POLYMARKET_SHORT_TERM_ASSETS,
     PREDICTION_ASSET_MAP,
     SYNTH_API_KEY,
     SYNTH_BASE_URL,
@@ -14,6 +28,54 @@ from backend.config import (
 
 logger = logging.getLogger("synth.client")
 
+# Short private alias for the prediction-endpoint asset map.
+_PRED_MAP: Final = PREDICTION_ASSET_MAP
+
+# Response-cache tuning. Only successful (200) responses are cached.
+_CACHE_TTL_DEFAULT = 30.0
+_CACHE_MAX_ENTRIES = 512
+
+# Pre-encoded query strings keyed by the sorted params tuple. Endpoint
+# params are small (asset, horizon, days, limit) and highly repetitive, so
+# encoding each combination once skips per-call QueryParams construction.
+_PARAM_CACHE: dict[tuple[Any, ...], str] = {}
+_PARAM_CACHE_MAX_ENTRIES = 1024
+
+# Per-path TTL overrides: leaderboards barely move within a session, while
+# live Polymarket odds go stale within seconds.
+_CACHE_TTL_OVERRIDES: dict[str, float] = {
+    "/v2/meta-leaderboard/latest": 300.0,
+    "/v2/leaderboard/latest": 300.0,
+    "/insights/polymarket/up-down/hourly": 10.0,
+    "/insights/polymarket/up-down/15min": 5.0,
+}
+
+
+@dataclass(frozen=True)
+class MinerList:
+    """Immutable miner-id list with its CSV query form computed once.
+
+    Callers polling the prediction endpoints with a stable set of miners
+    (e.g. top-N from the leaderboard) can build one MinerList and reuse it,
+    so the CSV join is paid once instead of per call.
+    """
+
+    ids: tuple[int, ...]
+
+    @cached_property
+    def csv(self) -> str:
+        return ",".join(map(str, self.ids))
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.ids)
+
+
+def _miner_csv(miner_ids: MinerList | list[int]) -> str:
+    """CSV query form of a miner-id collection."""
+    if isinstance(miner_ids, MinerList):
+        return miner_ids.csv
+    return ",".join(map(str, miner_ids))
+
 
 class SynthAPIError(Exception):
     """Raised when a Synth API request fails."""
@@ -28,11 +90,19 @@ class SynthClient:
     """Client for the Synth API (Bittensor Subnet 50).
 
     Provides typed access to all insight, prediction, and leaderboard endpoints.
-    Uses httpx for HTTP with automatic retries on transient failures.
+    Holds a single long-lived httpx.AsyncClient so the keep-alive connection
+    pool (and the TCP+TLS handshake cost) is shared across all endpoint calls.
+
+    Every endpoint has an async method (``aget_*``) for callers that want to
+    batch requests concurrently; the matching ``get_*`` methods are thin
+    synchronous wrappers for callers outside an event loop.
     """
 
     _HOURLY_WARN_THRESHOLD = 50
 
+    # Cap on miner ids merged into one prediction query, to keep URLs short.
+    _MAX_MINERS_PER_CALL = 200
+
     def __init__(
         self,
         api_key: str = SYNTH_API_KEY,
@@ -40,27 +110,143 @@ class SynthClient:
         timeout: float = 30.0,
         max_retries: int = 3,
     ) -> None:
-        self._base_url = base_url.rstrip("/")
-        self._timeout = timeout
-        self._transport = httpx.HTTPTransport(retries=max_retries)
         self._headers = {
             "Authorization": f"Apikey {api_key}",
             "Accept": "application/json",
         }
+        # Retry transient HTTP failures (not just connect errors) with
+        # jittered exponential backoff, honouring Retry-After on 429s.
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            respect_retry_after_header=True,
+        )
+        self._client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            headers=self._headers,
+            timeout=timeout,
+            # HTTP/2 lets concurrent fan-outs multiplex over one TLS
+            # connection instead of opening one per in-flight request. The
+            # pool limits must live on the transport: AsyncClient silently
+            # discards its limits= argument when an explicit transport is
+            # passed.
+            transport=RetryTransport(
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                ),
+                retry=retry,
+            ),
+        )
+        # Cap in-flight requests per client so gather-style fan-outs don't
+        # exhaust the connection pool.
+        self._semaphore = asyncio.Semaphore(16)
+        # Background event loop that owns all sync-wrapper I/O; started
+        # lazily on the first get_* call.
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._loop_lock = threading.Lock()
+        # LRU response cache keyed on (path, sorted params).
+        self._cache: OrderedDict[tuple[Any, ...], tuple[float, Any]] = OrderedDict()
         self._call_count: int = 0
         self._call_timestamps: list[float] = []
 
-    def _get(self, path: str, params: dict[str, Any] | None = None) -> Any:
-        """Execute a GET request with auth headers, error handling, and call counting."""
-        url = f"{self._base_url}{path}"
-        with httpx.Client(transport=self._transport, timeout=self._timeout) as client:
-            response = client.get(url, headers=self._headers, params=params)
+    async def _get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Execute a GET request with auth headers, error handling, and call counting.
+
+        Identical GETs within the per-path TTL are served from an in-memory
+        LRU cache instead of round-tripping to the API.
+        """
+        key = (path, tuple(sorted((params or {}).items())))
+        ttl = _CACHE_TTL_OVERRIDES.get(path, _CACHE_TTL_DEFAULT)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            fetched_at, data = cached
+            if time.monotonic() - fetched_at < ttl:
+                self._cache.move_to_end(key)
+                return data
+            del self._cache[key]
+
+        url = path
+        if params:
+            qs = _PARAM_CACHE.get(key[1])
+            if qs is None and all(isinstance(v, (str, int)) for v in params.values()):
+                qs = urlencode(sorted(params.items()))
+                if len(_PARAM_CACHE) < _PARAM_CACHE_MAX_ENTRIES:
+                    _PARAM_CACHE[key[1]] = qs
+            if qs is not None:
+                url = f"{path}?{qs}"
+                params = None
+
+        async with self._semaphore:
+            response = await self._client.get(url, params=params)
 
         if response.status_code != 200:
             raise SynthAPIError(response.status_code, response.text)
 
         self._record_call(path)
-        return response.json()
+        # orjson parses large payloads (historical predictions, leaderboards)
+        # several times faster than the stdlib parser behind response.json().
+        data = orjson.loads(response.content)
+
+        self._cache[key] = (time.monotonic(), data)
+        self._cache.move_to_end(key)
+        while len(self._cache) > _CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
+        return data
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start (once) and return the event loop thread backing sync calls."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="synth-client-io",
+                    daemon=True,
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def _run(self, coro: Any) -> Any:
+        """Drive a coroutine to completion from synchronous code.
+
+        Every sync wrapper dispatches onto one long-lived background loop, so
+        the AsyncClient's keep-alive pool and the request semaphore stay bound
+        to a single loop for the client's whole lifetime. (A fresh
+        asyncio.run() per call would close that loop — and the pooled
+        connections with it — on return, breaking the next call.)
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    def close(self) -> None:
+        """Close the pool and stop the background loop, from synchronous code."""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = None
+            self._loop_thread = None
+        if loop is None:
+            # No sync call ever ran; no connections belong to any live loop.
+            asyncio.run(self.aclose())
+            return
+        asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join()
+        loop.close()
+
+    async def __aenter__(self) -> "SynthClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
     def _record_call(self, path: str) -> None:
         """Record an API call and warn if rate is too high."""
@@ -90,9 +276,49 @@ class SynthClient:
                 calls_last_hour,
             )
 
+    # ── Batched fetching ───────────────────────────────────────────────
+
+    async def afetch_all_for_assets(
+        self,
+        assets: list[str] | None = None,
+    ) -> dict[tuple[str, str], Any]:
+        """Fetch every Polymarket comparison input for edge detection in one wave.
+
+        Issues the daily/hourly up-down request for each supported asset
+        concurrently via asyncio.gather, so total latency is bounded by the
+        slowest request rather than the sum of all round trips.
+
+        Returns:
+            Dict keyed by (asset, endpoint) — endpoint is "polymarket_daily"
+            or "polymarket_hourly" — mapping to the response payload, or to
+            the raised exception for requests that failed.
+        """
+        if assets is None:
+            assets = ASSETS
+
+        keys: list[tuple[str, str]] = []
+        coros: list[Any] = []
+        for asset in assets:
+            if asset in POLYMARKET_DAILY_ASSETS:
+                keys.append((asset, "polymarket_daily"))
+                coros.append(self.aget_polymarket_updown_daily(asset))
+            if asset in POLYMARKET_SHORT_TERM_ASSETS:
+                keys.append((asset, "polymarket_hourly"))
+                coros.append(self.aget_polymarket_updown_hourly(asset))
+
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        return dict(zip(keys, results))
+
+    def fetch_all_for_assets(
+        self,
+        assets: list[str] | None = None,
+    ) -> dict[tuple[str, str], Any]:
+        """Sync wrapper for afetch_all_for_assets."""
+        return self._run(self.afetch_all_for_assets(assets))
+
     # ── Insight Endpoints ──────────────────────────────────────────────
 
-    def get_prediction_percentiles(
+    async def aget_prediction_percentiles(
         self,
         asset: str,
         horizon: str = "24h",
@@ -100,12 +326,22 @@ class SynthClient:
         limit: int = DEFAULT_MINER_LIMIT,
     ) -> dict[str, Any]:
         """Price distribution percentiles at 9 levels over the forecast horizon."""
-        return self._get(
+        return await self._get(
             "/insights/prediction-percentiles",
             params={"asset": asset, "horizon": horizon, "days": days, "limit": limit},
         )
 
-    def get_volatility(
+    def get_prediction_percentiles(
+        self,
+        asset: str,
+        horizon: str = "24h",
+        days: int = DEFAULT_DAYS,
+        limit: int = DEFAULT_MINER_LIMIT,
+    ) -> dict[str, Any]:
+        """Sync wrapper for aget_prediction_percentiles."""
+        return self._run(self.aget_prediction_percentiles(asset, horizon, days, limit))
+
+    async def aget_volatility(
         self,
         asset: str,
         horizon: str = "24h",
@@ -113,12 +349,22 @@ class SynthClient:
         limit: int = DEFAULT_MINER_LIMIT,
     ) -> dict[str, Any]:
         """Ensemble volatility forecast from top meta-leaderboard miners."""
-        return self._get(
+        return await self._get(
             "/insights/volatility",
             params={"asset": asset, "horizon": horizon, "days": days, "limit": limit},
         )
 
-    def get_option_pricing(
+    def get_volatility(
+        self,
+        asset: str,
+        horizon: str = "24h",
+        days: int = DEFAULT_DAYS,
+        limit: int = DEFAULT_MINER_LIMIT,
+    ) -> dict[str, Any]:
+        """Sync wrapper for aget_volatility."""
+        return self._run(self.aget_volatility(asset, horizon, days, limit))
+
+    async def aget_option_pricing(
         self,
         asset: str,
         horizon: str = "24h",
@@ -126,12 +372,22 @@ class SynthClient:
         limit: int = DEFAULT_MINER_LIMIT,
     ) -> dict[str, Any]:
         """Theoretical call/put prices across strike prices."""
-        return self._get(
+        return await self._get(
             "/insights/option-pricing",
             params={"asset": asset, "horizon": horizon, "days": days, "limit": limit},
         )
 
-    def get_liquidation(
+    def get_option_pricing(
+        self,
+        asset: str,
+        horizon: str = "24h",
+        days: int = DEFAULT_DAYS,
+        limit: int = DEFAULT_MINER_LIMIT,
+    ) -> dict[str, Any]:
+        """Sync wrapper for aget_option_pricing."""
+        return self._run(self.aget_option_pricing(asset, horizon, days, limit))
+
+    async def aget_liquidation(
         self,
         asset: str,
         horizon: str = "24h",
@@ -139,12 +395,22 @@ class SynthClient:
         limit: int = DEFAULT_MINER_LIMIT,
     ) -> dict[str, Any]:
         """Long/short liquidation probabilities at various price levels."""
-        return self._get(
+        return await self._get(
             "/insights/liquidation",
             params={"asset": asset, "horizon": horizon, "days": days, "limit": limit},
         )
 
-    def get_lp_bounds(
+    def get_liquidation(
+        self,
+        asset: str,
+        horizon: str = "24h",
+        days: int = DEFAULT_DAYS,
+        limit: int = DEFAULT_MINER_LIMIT,
+    ) -> dict[str, Any]:
+        """Sync wrapper for aget_liquidation."""
+        return self._run(self.aget_liquidation(asset, horizon, days, limit))
+
+    async def aget_lp_bounds(
         self,
         asset: str,
         horizon: str = "24h",
@@ -152,12 +418,22 @@ class SynthClient:
         limit: int = DEFAULT_MINER_LIMIT,
     ) -> dict[str, Any]:
         """Price interval analysis with probability of staying in range and impermanent loss."""
-        return self._get(
+        return await self._get(
             "/insights/lp-bounds",
             params={"asset": asset, "horizon": horizon, "days": days, "limit": limit},
         )
 
-    def get_lp_probabilities(
+    def get_lp_bounds(
+        self,
+        asset: str,
+        horizon: str = "24h",
+        days: int = DEFAULT_DAYS,
+        limit: int = DEFAULT_MINER_LIMIT,
+    ) -> dict[str, Any]:
+        """Sync wrapper for aget_lp_bounds."""
+        return self._run(self.aget_lp_bounds(asset, horizon, days, limit))
+
+    async def aget_lp_probabilities(
         self,
         asset: str,
         horizon: str = "24h",
@@ -165,64 +441,110 @@ class SynthClient:
         limit: int = DEFAULT_MINER_LIMIT,
     ) -> dict[str, Any]:
         """Probability of price being above/below specific targets over the forecast horizon."""
-        return self._get(
+        return await self._get(
             "/insights/lp-probabilities",
             params={"asset": asset, "horizon": horizon, "days": days, "limit": limit},
         )
 
+    def get_lp_probabilities(
+        self,
+        asset: str,
+        horizon: str = "24h",
+        days: int = DEFAULT_DAYS,
+        limit: int = DEFAULT_MINER_LIMIT,
+    ) -> dict[str, Any]:
+        """Sync wrapper for aget_lp_probabilities."""
+        return self._run(self.aget_lp_probabilities(asset, horizon, days, limit))
+
     # ── Polymarket Endpoints ───────────────────────────────────────────
 
-    def get_polymarket_updown_daily(
+    async def aget_polymarket_updown_daily(
         self,
         asset: str,
         days: int = DEFAULT_DAYS,
         limit: int = DEFAULT_MINER_LIMIT,
     ) -> dict[str, Any]:
         """Synth fair probabilities vs live Polymarket odds for daily up/down contracts."""
-        return self._get(
+        return await self._get(
             "/insights/polymarket/up-down/daily",
             params={"asset": asset, "horizon": "24h", "days": days, "limit": limit},
         )
 
-    def get_polymarket_updown_hourly(
+    def get_polymarket_updown_daily(
+        self,
+        asset: str,
+        days: int = DEFAULT_DAYS,
+        limit: int = DEFAULT_MINER_LIMIT,
+    ) -> dict[str, Any]:
+        """Sync wrapper for aget_polymarket_updown_daily."""
+        return self._run(self.aget_polymarket_updown_daily(asset, days, limit))
+
+    async def aget_polymarket_updown_hourly(
         self,
         asset: str,
         days: int = DEFAULT_DAYS,
         limit: int = DEFAULT_MINER_LIMIT,
     ) -> dict[str, Any]:
         """Synth fair probabilities vs live Polymarket odds for hourly up/down contracts."""
-        return self._get(
+        return await self._get(
             "/insights/polymarket/up-down/hourly",
             params={"asset": asset, "horizon": "1h", "days": days, "limit": limit},
         )
 
-    def get_polymarket_updown_15min(
+    def get_polymarket_updown_hourly(
+        self,
+        asset: str,
+        days: int = DEFAULT_DAYS,
+        limit: int = DEFAULT_MINER_LIMIT,
+    ) -> dict[str, Any]:
+        """Sync wrapper for aget_polymarket_updown_hourly."""
+        return self._run(self.aget_polymarket_updown_hourly(asset, days, limit))
+
+    async def aget_polymarket_updown_15min(
         self,
         asset: str,
         days: int = DEFAULT_DAYS,
         limit: int = DEFAULT_MINER_LIMIT,
     ) -> dict[str, Any]:
         """Synth fair probabilities vs live Polymarket odds for 15-minute up/down contracts."""
-        return self._get(
+        return await self._get(
             "/insights/polymarket/up-down/15min",
             params={"asset": asset, "horizon": "1h", "days": days, "limit": limit},
         )
 
-    def get_polymarket_range(
+    def get_polymarket_updown_15min(
+        self,
+        asset: str,
+        days: int = DEFAULT_DAYS,
+        limit: int = DEFAULT_MINER_LIMIT,
+    ) -> dict[str, Any]:
+        """Sync wrapper for aget_polymarket_updown_15min."""
+        return self._run(self.aget_polymarket_updown_15min(asset, days, limit))
+
+    async def aget_polymarket_range(
         self,
         asset: str,
         days: int = DEFAULT_DAYS,
         limit: int = DEFAULT_MINER_LIMIT,
     ) -> list[dict[str, Any]]:
         """Synth fair probabilities vs live Polymarket odds for daily price range contracts."""
-        return self._get(
+        return await self._get(
             "/insights/polymarket/range",
             params={"asset": asset, "horizon": "24h", "days": days, "limit": limit},
         )
 
+    def get_polymarket_range(
+        self,
+        asset: str,
+        days: int = DEFAULT_DAYS,
+        limit: int = DEFAULT_MINER_LIMIT,
+    ) -> list[dict[str, Any]]:
+        """Sync wrapper for aget_polymarket_range."""
+        return self._run(self.aget_polymarket_range(asset, days, limit))
+
     # ── Prediction Endpoints ───────────────────────────────────────────
 
-    def get_best_prediction(
+    async def aget_best_prediction(
         self,
         asset: str,
         time_increment: int = 300,
@@ -235,8 +557,8 @@ class SynthClient:
             time_increment: Prediction interval in seconds (300 for 5min, 60 for 1min).
             time_length: Total forecast length in seconds (86400 for 24h, 3600 for 1h).
         """
-        prediction_asset = PREDICTION_ASSET_MAP.get(asset, asset)
-        return self._get(
+        prediction_asset = _PRED_MAP.get(asset, asset)
+        return await self._get(
             "/v2/prediction/best",
             params={
                 "asset": prediction_asset,
@@ -245,9 +567,18 @@ class SynthClient:
             },
         )
 
-    def get_latest_predictions(
+    def get_best_prediction(
+        self,
+        asset: str,
+        time_increment: int = 300,
+        time_length: int = 86400,
+    ) -> list[dict[str, Any]]:
+        """Sync wrapper for aget_best_prediction."""
+        return self._run(self.aget_best_prediction(asset, time_increment, time_length))
+
+    async def aget_latest_predictions(
         self,
-        miner_ids: list[int],
+        miner_ids: MinerList | list[int],
         asset: str,
         time_increment: int = 300,
         time_length: int = 86400,
@@ -260,20 +591,132 @@ class SynthClient:
             time_increment: Prediction interval in seconds.
             time_length: Total forecast length in seconds.
         """
-        prediction_asset = PREDICTION_ASSET_MAP.get(asset, asset)
-        return self._get(
+        prediction_asset = _PRED_MAP.get(asset, asset)
+        return await self._get(
             "/v2/prediction/latest",
             params={
-                "miner": ",".join(str(m) for m in miner_ids),
+                "miner": _miner_csv(miner_ids),
                 "asset": prediction_asset,
                 "time_increment": time_increment,
                 "time_length": time_length,
             },
         )
 
-    def get_historical_predictions(
+    def get_latest_predictions(
+        self,
+        miner_ids: MinerList | list[int],
+        asset: str,
+        time_increment: int = 300,
+        time_length: int = 86400,
+    ) -> list[dict[str, Any]]:
+        """Sync wrapper for aget_latest_predictions."""
+        return self._run(
+            self.aget_latest_predictions(miner_ids, asset, time_increment, time_length)
+        )
+
+    async def aget_latest_predictions_multi(
+        self,
+        requests: list[dict[str, Any]],
+    ) -> list[list[dict[str, Any]]]:
+        """Fetch latest predictions for several (miner_ids, asset) slices at once.
+
+        Requests sharing (asset, time_increment, time_length) are merged into
+        batched miner-id queries (capped at 200 ids per call to keep URLs
+        within limits), and all batched calls are issued concurrently. Rows
+        are then split back out per input request.
+
+        Args:
+            requests: Dicts with keys "miner_ids" and "asset", plus optional
+                "time_increment" (default 300) and "time_length" (default 86400).
+
+        Returns:
+            One list of prediction rows per input request, in input order.
+        """
+        # Merge miner ids per (asset, time_increment, time_length), deduped.
+        merged: dict[tuple[str, int, int], dict[int, None]] = {}
+        for req in requests:
+            key = (
+                req["asset"],
+                req.get("time_increment", 300),
+                req.get("time_length", 86400),
+            )
+            ids = merged.setdefault(key, {})
+            for m in req["miner_ids"]:
+                ids[int(m)] = None
+
+        # One call per batch of up to _MAX_MINERS_PER_CALL ids.
+        batch_keys: list[tuple[str, int, int]] = []
+        coros: list[Any] = []
+        for key, ids in merged.items():
+            id_list = list(ids)
+            for i in range(0, len(id_list), self._MAX_MINERS_PER_CALL):
+                batch_keys.append(key)
+                coros.append(
+                    self.aget_latest_predictions(
+                        id_list[i: i + self._MAX_MINERS_PER_CALL], key[0], key[1], key[2]
+                    )
+                )
+
+        batches = await asyncio.gather(*coros)
+
+        rows_by_key: dict[tuple[str, int, int], list[dict[str, Any]]] = {}
+        for key, rows in zip(batch_keys, batches):
+            rows_by_key.setdefault(key, []).extend(rows)
+
+        # Split merged rows back into the caller's original grouping.
+        ids_by_key = {
+            key: [self._row_miner_id(row) for row in rows]
+            for key, rows in rows_by_key.items()
+        }
+        results: list[list[dict[str, Any]]] = []
+        for req in requests:
+            key = (
+                req["asset"],
+                req.get("time_increment", 300),
+                req.get("time_length", 86400),
+            )
+            rows = rows_by_key.get(key, [])
+            row_ids = ids_by_key.get(key, [])
+            if rows and all(row_id is None for row_id in row_ids):
+                # The rows carry no recognisable miner-id field, so per-miner
+                # filtering is impossible. Pass the merged batch through
+                # (exact whenever this key served a single request) rather
+                # than silently returning nothing.
+                logger.warning(
+                    "No miner-id field in prediction rows for %s; "
+                    "returning merged batch unfiltered",
+                    key[0],
+                )
+                results.append(list(rows))
+                continue
+            wanted = {int(m) for m in req["miner_ids"]}
+            results.append([
+                row for row, row_id in zip(rows, row_ids) if row_id in wanted
+            ])
+        return results
+
+    def get_latest_predictions_multi(
         self,
-        miner_ids: list[int],
+        requests: list[dict[str, Any]],
+    ) -> list[list[dict[str, Any]]]:
+        """Sync wrapper for aget_latest_predictions_multi."""
+        return self._run(self.aget_latest_predictions_multi(requests))
+
+    @staticmethod
+    def _row_miner_id(row: dict[str, Any]) -> int | None:
+        """Extract the miner UID from a prediction row."""
+        for field in ("miner_uid", "miner_id", "miner"):
+            value = row.get(field)
+            if value is not None:
+                try:
+                    return int(value)
+                except (TypeError, ValueError):
+                    return None
+        return None
+
+    async def aget_historical_predictions(
+        self,
+        miner_ids: MinerList | list[int],
         asset: str,
         start_time: str,
         time_increment: int = 300,
@@ -288,11 +731,11 @@ class SynthClient:
             time_increment: Prediction interval in seconds.
             time_length: Total forecast length in seconds.
         """
-        prediction_asset = PREDICTION_ASSET_MAP.get(asset, asset)
-        return self._get(
+        prediction_asset = _PRED_MAP.get(asset, asset)
+        return await self._get(
             "/v2/prediction/historical",
             params={
-                "miner": ",".join(str(m) for m in miner_ids),
+                "miner": _miner_csv(miner_ids),
                 "asset": prediction_asset,
                 "start_time": start_time,
                 "time_increment": time_increment,
@@ -300,9 +743,70 @@ class SynthClient:
             },
         )
 
+    async def aiter_historical_predictions(
+        self,
+        miner_ids: MinerList | list[int],
+        asset: str,
+        start_time: str,
+        time_increment: int = 300,
+        time_length: int = 86400,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream historical prediction rows as they arrive on the wire.
+
+        Unlike aget_historical_predictions, the response array is never
+        materialized in memory: rows are parsed incrementally with ijson and
+        yielded one at a time, so downstream aggregation overlaps with the
+        network receive and peak RSS stays flat for large queries.
+
+        Takes the same arguments as aget_historical_predictions.
+        """
+        prediction_asset = _PRED_MAP.get(asset, asset)
+        path = "/v2/prediction/historical"
+        params = {
+            "miner": _miner_csv(miner_ids),
+            "asset": prediction_asset,
+            "start_time": start_time,
+            "time_increment": time_increment,
+            "time_length": time_length,
+        }
+
+        rows = ijson.sendable_list()
+        parser = ijson.items_coro(rows, "item")
+
+        async with self._client.stream("GET", path, params=params) as response:
+            if response.status_code != 200:
+                await response.aread()
+                raise SynthAPIError(response.status_code, response.text)
+
+            self._record_call(path)
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                for row in rows:
+                    yield row
+                del rows[:]
+
+        parser.close()
+        for row in rows:
+            yield row
+
+    def get_historical_predictions(
+        self,
+        miner_ids: MinerList | list[int],
+        asset: str,
+        start_time: str,
+        time_increment: int = 300,
+        time_length: int = 86400,
+    ) -> list[dict[str, Any]]:
+        """Sync wrapper for aget_historical_predictions."""
+        return self._run(
+            self.aget_historical_predictions(
+                miner_ids, asset, start_time, time_increment, time_length
+            )
+        )
+
     # ── Leaderboard Endpoints ──────────────────────────────────────────
 
-    def get_meta_leaderboard(
+    async def aget_meta_leaderboard(
         self,
         days: int = DEFAULT_DAYS,
         prompt_name: str | None = None,
@@ -316,9 +820,17 @@ class SynthClient:
         params: dict[str, Any] = {"days": days}
         if prompt_name is not None:
             params["prompt_name"] = prompt_name
-        return self._get("/v2/meta-leaderboard/latest", params=params)
+        return await self._get("/v2/meta-leaderboard/latest", params=params)
 
-    def get_leaderboard_latest(
+    def get_meta_leaderboard(
+        self,
+        days: int = DEFAULT_DAYS,
+        prompt_name: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Sync wrapper for aget_meta_leaderboard."""
+        return self._run(self.aget_meta_leaderboard(days, prompt_name))
+
+    async def aget_leaderboard_latest(
         self,
         prompt_name: str | None = None,
     ) -> list[dict[str, Any]]:
@@ -330,4 +842,34 @@ class SynthClient:
         params: dict[str, Any] = {}
         if prompt_name is not None:
             params["prompt_name"] = prompt_name
-        return self._get("/v2/leaderboard/latest", params=params)
+        return await self._get("/v2/leaderboard/latest", params=params)
+
+    def get_leaderboard_latest(
+        self,
+        prompt_name: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Sync wrapper for aget_leaderboard_latest."""
+        return self._run(self.aget_leaderboard_latest(prompt_name))
+
+
+_default_client: SynthClient | None = None
+
+
+def get_client() -> SynthClient:
+    """Process-wide SynthClient, created lazily on first use.
+
+    Sharing one instance means the keep-alive connection pool and the
+    response cache are amortized across every caller in the process
+    instead of being rebuilt per call site.
+    """
+    global _default_client
+    if _default_client is None:
+        _default_client = SynthClient()
+        atexit.register(_close_default_client)
+    return _default_client
+
+
+def _close_default_client() -> None:
+    if _default_client is not None:
+        # close() tears the pool down on the loop that owns its connections.
+        _default_client.close()
@@ -6,6 +6,10 @@ from Polymarket's market-implied probabilities.
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+
+import numpy as np
+
 from backend.config import (
     ASSETS,
     POLYMARKET_DAILY_ASSETS,
@@ -21,6 +25,142 @@ VERY_CONFIDENT_MARKET_THRESHOLD = 0.65
 BULLISH_SKEW_THRESHOLD = 1.50
 BEARISH_SKEW_THRESHOLD = 0.67
 
+# Precomputed (asset, timeframe, polymarket key, metrics key) iteration plan,
+# so detect_edges doesn't rebuild the nested loop structure per call.
+_PLAN: tuple[tuple[str, str, str, str], ...] = tuple(
+    (asset, timeframe, pm_key, f"{asset}_24h")
+    for asset in ASSETS
+    for timeframe, pm_key in (("daily", "polymarket_daily"), ("hourly", "polymarket_hourly"))
+)
+
+# Precompiled description templates, one per edge type. Formatting a
+# multi-spec f-string per edge is wasted work for consumers that only read
+# the structured fields, so descriptions are opt-out and rebuildable later
+# via render_description().
+_DESCRIPTION_TEMPLATES: dict[str, str] = {
+    "probability_divergence": (
+        "Synth prices {asset} Up at {synth_up:.1%} vs "
+        "Polymarket {pm_up:.1%} ({timeframe}, gap {abs_gap:.1%})"
+    ),
+    "tail_risk_underpriced": (
+        "Synth sees significant {risk_phrase} "
+        "(tail={tail_val:.2f}) but Polymarket prices Up at {pm_up:.1%}"
+    ),
+    "uncertainty_underpriced": (
+        "Synth shows dispersed distribution (density={density:.2f}) "
+        "but Polymarket confidently prices {market_direction} at {market_confidence:.1%}"
+    ),
+    "skew_mismatch_bullish": (
+        "Synth shows bullish skew (asymmetry={asymmetry:.2f}) "
+        "but Polymarket prices Down at {pm_down:.1%}"
+    ),
+    "skew_mismatch_bearish": (
+        "Synth shows bearish skew (asymmetry={asymmetry:.2f}) "
+        "but Polymarket prices Up at {pm_up:.1%}"
+    ),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Edge:
+    """A single detected mispricing.
+
+    Slotted so that detecting hundreds of edges per snapshot allocates one
+    fixed-layout object per edge instead of three dicts, and so downstream
+    sorts/filters use attribute access rather than keyed lookups.
+    """
+
+    asset: str
+    edge_type: str
+    timeframe: str
+    direction: str
+    confidence: str
+    synth_signal: dict = field(default_factory=dict)
+    polymarket_price: dict = field(default_factory=dict)
+    description: str = ""
+
+    def to_dict(self) -> dict:
+        """Dict form for the serialization boundary (JSON export, HTTP)."""
+        out = {
+            "asset": self.asset,
+            "edge_type": self.edge_type,
+            "timeframe": self.timeframe,
+            "direction": self.direction,
+            "confidence": self.confidence,
+            "synth_signal": self.synth_signal,
+            "polymarket_price": self.polymarket_price,
+        }
+        if self.description:
+            out["description"] = self.description
+        return out
+
+
+def render_description(edge: Edge) -> str:
+    """Rebuild the human-readable description from an edge's structured fields.
+
+    For edges produced with include_descriptions=False, this produces the
+    same string detect_edges would have attached.
+    """
+    edge_type = edge.edge_type
+    direction = edge.direction
+    signal = edge.synth_signal
+    pm_up = edge.polymarket_price.get("probability_up", 0.0)
+
+    if edge_type == "probability_divergence":
+        gap = signal.get("gap", 0.0)
+        return _DESCRIPTION_TEMPLATES[edge_type].format_map({
+            "asset": edge.asset,
+            "synth_up": signal.get("synth_probability_up", 0.0),
+            "pm_up": pm_up,
+            "timeframe": edge.timeframe,
+            "abs_gap": abs(gap),
+        })
+
+    if edge_type == "tail_risk_underpriced":
+        tail_val = (
+            signal.get("lower_tail_risk", 0.0)
+            if direction == "DOWN_RISK"
+            else signal.get("upper_tail_risk", 0.0)
+        )
+        return _DESCRIPTION_TEMPLATES[edge_type].format_map({
+            "risk_phrase": direction.lower().replace("_", " "),
+            "tail_val": tail_val,
+            "pm_up": pm_up,
+        })
+
+    if edge_type == "uncertainty_underpriced":
+        return _DESCRIPTION_TEMPLATES[edge_type].format_map({
+            "density": signal.get("density_concentration", 0.0),
+            "market_direction": direction.removeprefix("AGAINST_"),
+            "market_confidence": max(pm_up, 1 - pm_up),
+        })
+
+    if edge_type == "skew_mismatch":
+        key = (
+            "skew_mismatch_bullish"
+            if direction == "SKEW_BULLISH"
+            else "skew_mismatch_bearish"
+        )
+        return _DESCRIPTION_TEMPLATES[key].format_map({
+            "asymmetry": signal.get("tail_asymmetry", 1.0),
+            "pm_up": pm_up,
+            "pm_down": 1 - pm_up,
+        })
+
+    return ""
+
+
+def _unpack_metrics(metrics: dict) -> tuple[float, float, float, float, float, float]:
+    """Unpack the six metric fields the edge checks read, with their defaults."""
+    return (
+        metrics.get("upper_tail_risk", 0),
+        metrics.get("lower_tail_risk", 0),
+        metrics.get("forecast_width", 0),
+        metrics.get("density_concentration", 1.0),
+        metrics.get("tail_asymmetry", 1.0),
+        metrics.get("directional_bias", 0),
+    )
+
 
 class EdgeDetector:
     """Detects mispricings between Synth distribution signals and Polymarket."""
@@ -29,69 +169,213 @@ class EdgeDetector:
         self,
         snapshot: dict,
         distribution_metrics: dict,
-    ) -> list[dict]:
+        include_descriptions: bool = True,
+    ) -> list[Edge]:
         """Find all edges across assets.
 
         Args:
             snapshot: Raw AlphaLog snapshot.
             distribution_metrics: Output from DistributionAnalyzer.analyze_snapshot().
+            include_descriptions: Attach a formatted "description" string per
+                edge. Consumers that only read structured fields can pass
+                False and rebuild strings later via render_description().
 
         Returns:
-            List of detected edge dicts, sorted by confidence.
+            List of detected Edge objects, sorted by confidence.
+        """
+        # Bucket per confidence tier as we detect, so the HIGH-first ordering
+        # falls out of a final concatenation instead of a keyed sort.
+        high: list[Edge] = []
+        medium: list[Edge] = []
+        low: list[Edge] = []
+        buckets = {"HIGH": high, "MEDIUM": medium, "LOW": low}
+        assets_data = snapshot.get("assets", {})
+        # Metrics are keyed per asset, so the unpack is identical for the
+        # daily and hourly timeframes — do it once per metrics key.
+        unpacked: dict[str, tuple[float, float, float, float, float, float]] = {}
+
+        for asset, timeframe, pm_key, metrics_key in _PLAN:
+            asset_data = assets_data.get(asset)
+            if not asset_data:
+                continue
+
+            # 24h metrics (primary horizon for edge detection)
+            metrics = distribution_metrics.get(metrics_key)
+
+            pm_data = asset_data.get(pm_key)
+            if not pm_data:
+                continue
+
+            synth_up = pm_data.get("synth_probability_up")
+            pm_up = pm_data.get("polymarket_probability_up")
+            if synth_up is None or pm_up is None:
+                continue
+
+            # 1. Simple probability edge
+            edge = self._check_probability_edge(
+                asset, timeframe, synth_up, pm_up, include_descriptions
+            )
+            if edge:
+                buckets.get(edge.confidence, low).append(edge)
+
+            # Distribution-based edges require metrics
+            if not metrics:
+                continue
+
+            vals = unpacked.get(metrics_key)
+            if vals is None:
+                vals = unpacked[metrics_key] = _unpack_metrics(metrics)
+            upper_tail, lower_tail, width, density, asymmetry, bias = vals
+
+            # 2. Tail risk underpriced
+            edge = self._check_tail_risk_underpriced(
+                asset, timeframe, upper_tail, lower_tail, width, pm_up,
+                include_descriptions,
+            )
+            if edge:
+                buckets.get(edge.confidence, low).append(edge)
+
+            # 3. Uncertainty underpriced
+            edge = self._check_uncertainty_underpriced(
+                asset, timeframe, density, width, pm_up, include_descriptions
+            )
+            if edge:
+                buckets.get(edge.confidence, low).append(edge)
+
+            # 4. Skew mismatch
+            edge = self._check_skew_mismatch(
+                asset, timeframe, asymmetry, bias, pm_up, include_descriptions
+            )
+            if edge:
+                buckets.get(edge.confidence, low).append(edge)
+
+        return high + medium + low
+
+    def detect_edges_vectorized(
+        self,
+        snapshot: dict,
+        distribution_metrics: dict,
+        include_descriptions: bool = True,
+    ) -> list[Edge]:
+        """Vectorized variant of detect_edges using SoA NumPy threshold masks.
+
+        Collects one row per (asset, timeframe) into contiguous float arrays,
+        evaluates all four edge conditions as vectorized mask operations, and
+        only materializes Edge objects (via the scalar _check_* builders) for
+        rows whose mask is True. Detects the same edges as detect_edges,
+        though ordering within a confidence tier may differ.
         """
-        edges: list[dict] = []
         assets_data = snapshot.get("assets", {})
 
-        for asset in ASSETS:
+        rows: list[tuple[str, str]] = []
+        has_metrics_flags: list[bool] = []
+        synth_up_vals: list[float] = []
+        pm_up_vals: list[float] = []
+        upper_tail_vals: list[float] = []
+        lower_tail_vals: list[float] = []
+        width_vals: list[float] = []
+        density_vals: list[float] = []
+        asymmetry_vals: list[float] = []
+        bias_vals: list[float] = []
+
+        for asset, timeframe, pm_key, metrics_key in _PLAN:
             asset_data = assets_data.get(asset)
             if not asset_data:
                 continue
+            pm_data = asset_data.get(pm_key)
+            if not pm_data:
+                continue
+            synth_up = pm_data.get("synth_probability_up")
+            pm_up = pm_data.get("polymarket_probability_up")
+            if synth_up is None or pm_up is None:
+                continue
+
+            metrics = distribution_metrics.get(metrics_key)
+            rows.append((asset, timeframe))
+            has_metrics_flags.append(bool(metrics))
+            synth_up_vals.append(synth_up)
+            pm_up_vals.append(pm_up)
+            upper, lower, width, dens, asym, bias = _unpack_metrics(metrics or {})
+            upper_tail_vals.append(upper)
+            lower_tail_vals.append(lower)
+            width_vals.append(width)
+            density_vals.append(dens)
+            asymmetry_vals.append(asym)
+            bias_vals.append(bias)
+
+        if not rows:
+            return []
+
+        synth_up_arr = np.asarray(synth_up_vals, dtype=np.float64)
+        pm_up_arr = np.asarray(pm_up_vals, dtype=np.float64)
+        upper_tail = np.asarray(upper_tail_vals, dtype=np.float64)
+        lower_tail = np.asarray(lower_tail_vals, dtype=np.float64)
+        density = np.asarray(density_vals, dtype=np.float64)
+        asymmetry = np.asarray(asymmetry_vals, dtype=np.float64)
+        has_metrics = np.asarray(has_metrics_flags, dtype=bool)
+
+        prob_mask = np.abs(synth_up_arr - pm_up_arr) > PROB_EDGE_THRESHOLD
+
+        tail_mask = has_metrics & (
+            ((lower_tail > TAIL_RISK_THRESHOLD) & (pm_up_arr > VERY_CONFIDENT_MARKET_THRESHOLD))
+            | (
+                (upper_tail > TAIL_RISK_THRESHOLD)
+                & (pm_up_arr < 1 - VERY_CONFIDENT_MARKET_THRESHOLD)
+            )
+        )
+
+        market_confidence = np.maximum(pm_up_arr, 1 - pm_up_arr)
+        uncertainty_mask = has_metrics & (density < DISPERSION_THRESHOLD) & (
+            market_confidence > CONFIDENT_MARKET_THRESHOLD
+        )
+
+        skew_mask = has_metrics & (
+            ((asymmetry > BULLISH_SKEW_THRESHOLD) & (pm_up_arr < 0.50))
+            | ((asymmetry < BEARISH_SKEW_THRESHOLD) & (pm_up_arr > 0.50))
+        )
+
+        high: list[Edge] = []
+        medium: list[Edge] = []
+        low: list[Edge] = []
+        buckets = {"HIGH": high, "MEDIUM": medium, "LOW": low}
+
+        for i in np.flatnonzero(prob_mask):
+            asset, timeframe = rows[i]
+            edge = self._check_probability_edge(
+                asset, timeframe, synth_up_vals[i], pm_up_vals[i],
+                include_descriptions,
+            )
+            if edge:
+                buckets.get(edge.confidence, low).append(edge)
+
+        for i in np.flatnonzero(tail_mask):
+            asset, timeframe = rows[i]
+            edge = self._check_tail_risk_underpriced(
+                asset, timeframe, upper_tail_vals[i], lower_tail_vals[i],
+                width_vals[i], pm_up_vals[i], include_descriptions,
+            )
+            if edge:
+                buckets.get(edge.confidence, low).append(edge)
+
+        for i in np.flatnonzero(uncertainty_mask):
+            asset, timeframe = rows[i]
+            edge = self._check_uncertainty_underpriced(
+                asset, timeframe, density_vals[i], width_vals[i], pm_up_vals[i],
+                include_descriptions,
+            )
+            if edge:
+                buckets.get(edge.confidence, low).append(edge)
+
+        for i in np.flatnonzero(skew_mask):
+            asset, timeframe = rows[i]
+            edge = self._check_skew_mismatch(
+                asset, timeframe, asymmetry_vals[i], bias_vals[i], pm_up_vals[i],
+                include_descriptions,
+            )
+            if edge:
+                buckets.get(edge.confidence, low).append(edge)
 
-            # Get 24h metrics (primary horizon for edge detection)
-            metrics = distribution_metrics.get(f"{asset}_24h")
-
-            # Check each Polymarket timeframe
-            for timeframe, pm_key in [
-                ("daily", "polymarket_daily"),
-                ("hourly", "polymarket_hourly"),
-            ]:
-                pm_data = asset_data.get(pm_key)
-                if not pm_data:
-                    continue
-
-                synth_up = pm_data.get("synth_probability_up")
-                pm_up = pm_data.get("polymarket_probability_up")
-                if synth_up is None or pm_up is None:
-                    continue
-
-                # 1. Simple probability edge
-                edge = self._check_probability_edge(asset, timeframe, synth_up, pm_up)
-                if edge:
-                    edges.append(edge)
-
-                # Distribution-based edges require metrics
-                if not metrics:
-                    continue
-
-                # 2. Tail risk underpriced
-                edge = self._check_tail_risk_underpriced(asset, timeframe, metrics, pm_up)
-                if edge:
-                    edges.append(edge)
-
-                # 3. Uncertainty underpriced
-                edge = self._check_uncertainty_underpriced(asset, timeframe, metrics, pm_up)
-                if edge:
-                    edges.append(edge)
-
-                # 4. Skew mismatch
-                edge = self._check_skew_mismatch(asset, timeframe, metrics, pm_up)
-                if edge:
-                    edges.append(edge)
-
-        # Sort by confidence: HIGH first, then MEDIUM, then LOW
-        confidence_order = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
-        edges.sort(key=lambda e: confidence_order.get(e["confidence"], 3))
-        return edges
+        return high + medium + low
 
     def _check_probability_edge(
         self,
@@ -99,7 +383,8 @@ class EdgeDetector:
         timeframe: str,
         synth_up: float,
         pm_up: float,
-    ) -> dict | None:
+        include_description: bool = True,
+    ) -> Edge | None:
         """Detect simple probability divergence."""
         gap = synth_up - pm_up
         abs_gap = abs(gap)
@@ -110,35 +395,47 @@ class EdgeDetector:
         direction = "UP" if gap > 0 else "DOWN"
         confidence = "HIGH" if abs_gap > PROB_EDGE_THRESHOLD * 2 else "MEDIUM"
 
-        return {
-            "asset": asset,
-            "edge_type": "probability_divergence",
-            "timeframe": timeframe,
-            "direction": direction,
-            "confidence": confidence,
-            "synth_signal": {
-                "synth_probability_up": round(synth_up, 4),
-                "gap": round(gap, 4),
+        # Round once and format descriptions from the same rounded values
+        # stored on the edge, so render_description() rebuilds the identical
+        # string from the structured fields.
+        synth_up_r = round(synth_up, 4)
+        pm_up_r = round(pm_up, 4)
+        gap_r = round(gap, 4)
+
+        description = ""
+        if include_description:
+            description = _DESCRIPTION_TEMPLATES["probability_divergence"].format_map({
+                "asset": asset,
+                "synth_up": synth_up_r,
+                "pm_up": pm_up_r,
+                "timeframe": timeframe,
+                "abs_gap": abs(gap_r),
+            })
+        return Edge(
+            asset=asset,
+            edge_type="probability_divergence",
+            timeframe=timeframe,
+            direction=direction,
+            confidence=confidence,
+            synth_signal={
+                "synth_probability_up": synth_up_r,
+                "gap": gap_r,
             },
-            "polymarket_price": {"probability_up": round(pm_up, 4)},
-            "description": (
-                f"Synth prices {asset} Up at {synth_up:.1%} vs "
-                f"Polymarket {pm_up:.1%} ({timeframe}, gap {abs_gap:.1%})"
-            ),
-        }
+            polymarket_price={"probability_up": pm_up_r},
+            description=description,
+        )
 
     def _check_tail_risk_underpriced(
         self,
         asset: str,
         timeframe: str,
-        metrics: dict,
+        upper_tail: float,
+        lower_tail: float,
+        width: float,
         pm_up: float,
-    ) -> dict | None:
+        include_description: bool = True,
+    ) -> Edge | None:
         """Detect heavy tails not reflected in Polymarket's confident pricing."""
-        upper_tail = metrics.get("upper_tail_risk", 0)
-        lower_tail = metrics.get("lower_tail_risk", 0)
-        width = metrics.get("forecast_width", 0)
-
         has_upper_tail = upper_tail > TAIL_RISK_THRESHOLD
         has_lower_tail = lower_tail > TAIL_RISK_THRESHOLD
 
@@ -158,34 +455,40 @@ class EdgeDetector:
         strength = max(upper_tail, lower_tail) / TAIL_RISK_THRESHOLD
         confidence = "HIGH" if strength > 2.0 else "MEDIUM"
 
-        return {
-            "asset": asset,
-            "edge_type": "tail_risk_underpriced",
-            "timeframe": timeframe,
-            "direction": direction,
-            "confidence": confidence,
-            "synth_signal": {
+        pm_up_r = round(pm_up, 4)
+
+        description = ""
+        if include_description:
+            description = _DESCRIPTION_TEMPLATES["tail_risk_underpriced"].format_map({
+                "risk_phrase": direction.lower().replace("_", " "),
+                "tail_val": round(tail_val, 4),
+                "pm_up": pm_up_r,
+            })
+        return Edge(
+            asset=asset,
+            edge_type="tail_risk_underpriced",
+            timeframe=timeframe,
+            direction=direction,
+            confidence=confidence,
+            synth_signal={
                 "lower_tail_risk": round(lower_tail, 4),
                 "upper_tail_risk": round(upper_tail, 4),
                 "forecast_width": f"{width:.2%}",
             },
-            "polymarket_price": {"probability_up": round(pm_up, 4)},
-            "description": (
-                f"Synth sees significant {direction.lower().replace('_', ' ')} "
-                f"(tail={tail_val:.2f}) but Polymarket prices Up at {pm_up:.1%}"
-            ),
-        }
+            polymarket_price={"probability_up": pm_up_r},
+            description=description,
+        )
 
     def _check_uncertainty_underpriced(
         self,
         asset: str,
         timeframe: str,
-        metrics: dict,
+        density: float,
+        width: float,
         pm_up: float,
-    ) -> dict | None:
+        include_description: bool = True,
+    ) -> Edge | None:
         """Detect dispersed distributions vs confident market pricing."""
-        density = metrics.get("density_concentration", 1.0)
-
         if density >= DISPERSION_THRESHOLD:
             return None
 
@@ -197,33 +500,40 @@ class EdgeDetector:
         direction = "UP" if pm_up > 0.5 else "DOWN"
         confidence = "HIGH" if density < 0.15 and market_confidence > 0.70 else "MEDIUM"
 
-        return {
-            "asset": asset,
-            "edge_type": "uncertainty_underpriced",
-            "timeframe": timeframe,
-            "direction": f"AGAINST_{direction}",
-            "confidence": confidence,
-            "synth_signal": {
-                "density_concentration": round(density, 4),
-                "forecast_width": f"{metrics.get('forecast_width', 0):.2%}",
+        density_r = round(density, 4)
+        pm_up_r = round(pm_up, 4)
+
+        description = ""
+        if include_description:
+            description = _DESCRIPTION_TEMPLATES["uncertainty_underpriced"].format_map({
+                "density": density_r,
+                "market_direction": direction,
+                "market_confidence": max(pm_up_r, 1 - pm_up_r),
+            })
+        return Edge(
+            asset=asset,
+            edge_type="uncertainty_underpriced",
+            timeframe=timeframe,
+            direction=f"AGAINST_{direction}",
+            confidence=confidence,
+            synth_signal={
+                "density_concentration": density_r,
+                "forecast_width": f"{width:.2%}",
             },
-            "polymarket_price": {"probability_up": round(pm_up, 4)},
-            "description": (
-                f"Synth shows dispersed distribution (density={density:.2f}) "
-                f"but Polymarket confidently prices {direction} at {market_confidence:.1%}"
-            ),
-        }
+            polymarket_price={"probability_up": pm_up_r},
+            description=description,
+        )
 
     def _check_skew_mismatch(
         self,
         asset: str,
         timeframe: str,
-        metrics: dict,
+        asymmetry: float,
+        bias: float,
         pm_up: float,
-    ) -> dict | None:
+        include_description: bool = True,
+    ) -> Edge | None:
         """Detect skew direction contradicting Polymarket pricing."""
-        asymmetry = metrics.get("tail_asymmetry", 1.0)
-
         bullish_skew = asymmetry > BULLISH_SKEW_THRESHOLD
         bearish_skew = asymmetry < BEARISH_SKEW_THRESHOLD
 
@@ -236,32 +546,32 @@ class EdgeDetector:
         if bearish_skew and pm_up <= 0.50:
             return None  # Both agree on Down
 
-        if bullish_skew:
-            direction = "SKEW_BULLISH"
-            desc = (
-                f"Synth shows bullish skew (asymmetry={asymmetry:.2f}) "
-                f"but Polymarket prices Down at {1 - pm_up:.1%}"
-            )
-        else:
-            direction = "SKEW_BEARISH"
-            desc = (
-                f"Synth shows bearish skew (asymmetry={asymmetry:.2f}) "
-                f"but Polymarket prices Up at {pm_up:.1%}"
-            )
+        direction = "SKEW_BULLISH" if bullish_skew else "SKEW_BEARISH"
 
         strength = abs(asymmetry - 1.0) / (BULLISH_SKEW_THRESHOLD - 1.0)
         confidence = "HIGH" if strength > 2.0 else "MEDIUM" if strength > 1.0 else "LOW"
 
-        return {
-            "asset": asset,
-            "edge_type": "skew_mismatch",
-            "timeframe": timeframe,
-            "direction": direction,
-            "confidence": confidence,
-            "synth_signal": {
-                "tail_asymmetry": round(asymmetry, 4),
-                "directional_bias": round(metrics.get("directional_bias", 0), 6),
+        asymmetry_r = round(asymmetry, 4)
+        pm_up_r = round(pm_up, 4)
+
+        description = ""
+        if include_description:
+            template_key = "skew_mismatch_bullish" if bullish_skew else "skew_mismatch_bearish"
+            description = _DESCRIPTION_TEMPLATES[template_key].format_map({
+                "asymmetry": asymmetry_r,
+                "pm_up": pm_up_r,
+                "pm_down": 1 - pm_up_r,
+            })
+        return Edge(
+            asset=asset,
+            edge_type="skew_mismatch",
+            timeframe=timeframe,
+            direction=direction,
+            confidence=confidence,
+            synth_signal={
+                "tail_asymmetry": asymmetry_r,
+                "directional_bias": round(bias, 6),
             },
-            "polymarket_price": {"probability_up": round(pm_up, 4)},
-            "description": desc,
-        }
+            polymarket_price={"probability_up": pm_up_r},
+            description=description,
+        )
@@ -12,11 +12,14 @@ import logging
 import math
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 from backend.config import SUPABASE_KEY, SUPABASE_URL
 
+if TYPE_CHECKING:
+    from backend.analysis.edge_detector import Edge
+
 logger = logging.getLogger("alphalog.edge_tracker")
 
 # Directions that indicate a simple Up/Down bet
@@ -58,7 +61,7 @@ class EdgeTracker:
 
     def record_edges(
         self,
-        edges: list[dict],
+        edges: list[Edge],
         snapshot: dict,
     ) -> int:
         """Record new edges from EdgeDetector with resolution metadata.
@@ -79,9 +82,9 @@ class EdgeTracker:
         recorded = 0
 
         for edge in edges:
-            asset = edge.get("asset", "")
+            asset = edge.asset
             asset_data = assets_data.get(asset, {})
-            timeframe = edge.get("timeframe", "daily")
+            timeframe = edge.timeframe or "daily"
 
             # Extract Polymarket data for deadline and prices
             pm_key = f"polymarket_{timeframe}"
@@ -92,13 +95,13 @@ class EdgeTracker:
                 continue
 
             # Determine the probabilities for PnL calculation
-            synth_signal = edge.get("synth_signal", {})
-            pm_price = edge.get("polymarket_price", {})
+            synth_signal = edge.synth_signal
+            pm_price = edge.polymarket_price
             synth_prob = synth_signal.get("synth_probability_up")
             pm_prob = pm_price.get("probability_up")
 
             # For edge direction, compute the probability of "our side"
-            direction = edge.get("direction", "")
+            direction = edge.direction
             our_pm_prob = self._our_side_probability(direction, pm_prob)
 
             edge_size = abs((synth_prob or 0) - (pm_prob or 0)) if synth_prob is not None and pm_prob is not None else None
@@ -107,10 +110,10 @@ class EdgeTracker:
                 "id": str(uuid4()),
                 "detected_at": snapshot_ts,
                 "asset": asset,
-                "edge_type": edge.get("edge_type", ""),
+                "edge_type": edge.edge_type,
                 "timeframe": timeframe,
                 "direction": direction,
-                "confidence": edge.get("confidence", ""),
+                "confidence": edge.confidence,
                 "synth_probability": synth_prob,
                 "polymarket_probability": pm_prob,
                 "our_side_pm_probability": our_pm_prob,
@@ -24,7 +24,7 @@ from rich.text import Text
 
 from backend.analysis.distribution import DistributionAnalyzer
 from backend.analysis.synth_index import SynthIndex
-from backend.analysis.edge_detector import EdgeDetector
+from backend.analysis.edge_detector import Edge, EdgeDetector
 from backend.analysis.anomaly_detector import AnomalyDetector
 from backend.analysis.edge_tracker import EdgeTracker
 from backend.analysis.cross_asset import CrossAssetAnalyzer
@@ -132,7 +132,7 @@ def render_index_table(index_data: dict) -> Table:
     return table
 
 
-def render_edges(edges: list[dict]) -> None:
+def render_edges(edges: list[Edge]) -> None:
     """Print detected edges."""
     if not edges:
         console.print("\n[dim]No edges detected.[/]")
@@ -149,14 +149,14 @@ def render_edges(edges: list[dict]) -> None:
     conf_colors = {"HIGH": "bold red", "MEDIUM": "yellow", "LOW": "dim"}
 
     for e in edges:
-        color = conf_colors.get(e["confidence"], "white")
+        color = conf_colors.get(e.confidence, "white")
         table.add_row(
-            e["asset"],
-            e["edge_type"],
-            e.get("timeframe", ""),
-            e["direction"],
-            f"[{color}]{e['confidence']}[/]",
-            e["description"],
+            e.asset,
+            e.edge_type,
+            e.timeframe,
+            e.direction,
+            f"[{color}]{e.confidence}[/]",
+            e.description,
         )
 
     console.print()
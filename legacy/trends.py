@@ -6,12 +6,25 @@ evolve over time across all collected snapshots.
 
 from __future__ import annotations
 
-import json
 import logging
 import math
+import os
+import pickle
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
+import numpy as np
+import orjson
+import pandas as pd
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from backend.analysis.distribution import DistributionAnalyzer
 from backend.analysis.synth_index import SynthIndex
 
@@ -20,22 +33,138 @@ logger = logging.getLogger("alphalog.trends")
 SNAPSHOTS_DIR = Path("data/snapshots")
 EDGES_DIR = Path("data/edges")
 EXPORTS_DIR = Path("data/exports")
+CACHE_DIR = Path("data/cache")
+
+# On-disk memo of per-snapshot analysis results, keyed by
+# "{schema}:{path}:{mtime_ns}" so only new or modified snapshot files pay
+# the analyze cost on re-runs. Bump the schema version whenever
+# DistributionAnalyzer/SynthIndex output changes, so stale entries are
+# discarded instead of served forever.
+_HISTORY_CACHE_SCHEMA = 1
+_HISTORY_CACHE_PATH = CACHE_DIR / "trends_history.pkl"
+
+
+def _snapshot_paths(data_dir: Path) -> list[Path]:
+    """Enumerate */*_snapshot.json under data_dir with scandir.
+
+    An explicit two-level scandir walk batches readdir calls, unlike
+    Path.glob's pattern matcher — noticeably faster on network filesystems
+    once snapshots number in the thousands.
+    """
+    paths: list[Path] = []
+    try:
+        with os.scandir(data_dir) as subdirs:
+            for sub in subdirs:
+                if not sub.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(sub.path) as entries:
+                    paths.extend(
+                        Path(entry.path)
+                        for entry in entries
+                        if entry.name.endswith("_snapshot.json")
+                    )
+    except OSError:
+        return []
+    paths.sort()
+    return paths
+
+
+def _load_snapshot(path: Path) -> dict | None:
+    """Read and parse one snapshot file; None on malformed/unreadable input."""
+    try:
+        return orjson.loads(path.read_bytes())
+    except (orjson.JSONDecodeError, OSError) as exc:
+        logger.warning("Skipping malformed snapshot %s: %s", path, exc)
+        return None
 
 
 def _parse_ts(ts: str) -> datetime:
+    """Parse an ISO-8601 timestamp.
+
+    Only used for arithmetic (e.g. hours covered). Sorting never parses:
+    snapshot timestamps are ISO-8601 UTC, which sorts lexicographically in
+    the same order as the datetimes, so sort keys stay plain strings.
+    """
     return datetime.fromisoformat(ts)
 
 
-def _linear_slope(values: list[float]) -> float:
-    """Simple linear regression slope over indices 0..n-1."""
-    n = len(values)
-    if n < 2:
-        return 0.0
-    x_mean = (n - 1) / 2
-    y_mean = sum(values) / n
-    num = sum((i - x_mean) * (v - y_mean) for i, v in enumerate(values))
-    den = sum((i - x_mean) ** 2 for i in range(n))
-    return num / den if den > 0 else 0.0
+# Numeric columns stored per key in distribution_history, in the order they
+# are read from each snapshot's metrics.
+_DIST_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("bias", "directional_bias"),
+    ("width", "forecast_width"),
+    ("skew", "tail_asymmetry"),
+    ("tail_fatness", "tail_fatness"),
+    ("upper_tail", "upper_tail_risk"),
+    ("lower_tail", "lower_tail_risk"),
+    ("density", "density_concentration"),
+)
+
+
+def _si_rows(series: dict) -> list[dict]:
+    """Row-dict view of one SoA synth-index series, for the export boundary."""
+    return [
+        {"timestamp": ts, "value": value, "level": level}
+        for ts, value, level in zip(
+            series["timestamp"], series["value"].tolist(), series["level"]
+        )
+    ]
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _linear_slope(values: np.ndarray) -> float:
+        """Simple linear regression slope over indices 0..n-1 (JIT-compiled)."""
+        n = values.shape[0]
+        if n < 2:
+            return 0.0
+        x_mean = (n - 1) / 2
+        y_mean = values.mean()
+        num = 0.0
+        den = 0.0
+        for i in range(n):
+            dx = i - x_mean
+            num += dx * (values[i] - y_mean)
+            den += dx * dx
+        return num / den if den > 0.0 else 0.0
+
+else:
+
+    def _linear_slope(values: np.ndarray) -> float:
+        """Simple linear regression slope over indices 0..n-1."""
+        n = values.shape[0]
+        if n < 2:
+            return 0.0
+        x = np.arange(n, dtype=np.float64)
+        x -= (n - 1) / 2
+        den = float(np.dot(x, x))
+        if den <= 0:
+            return 0.0
+        return float(np.dot(x, values - values.mean()) / den)
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _count_flips(values: np.ndarray) -> int:
+        """Count crossings of 1.0 in a series (JIT-compiled scalar loop)."""
+        if values.shape[0] < 2:
+            return 0
+        prev = values[0] >= 1.0
+        count = 0
+        for i in range(1, values.shape[0]):
+            cur = values[i] >= 1.0
+            count += cur != prev
+            prev = cur
+        return count
+
+else:
+
+    def _count_flips(values: np.ndarray) -> int:
+        """Count crossings of 1.0 in a series."""
+        mask = values >= 1.0
+        return int(np.count_nonzero(mask[1:] != mask[:-1]))
 
 
 class TrendAnalyzer:
@@ -49,29 +178,102 @@ class TrendAnalyzer:
     def load_all_snapshots(self) -> list[tuple[str, dict]]:
         """Walk data/snapshots/ directory, load all JSON files, sort by timestamp.
 
+        Timestamps must be ISO-8601 UTC; they are compared as strings, which
+        orders identically to the parsed datetimes without allocating one
+        datetime object per comparison.
+
         Returns:
             List of (timestamp, snapshot) tuples sorted chronologically.
         """
-        if not self._data_dir.exists():
+        paths = _snapshot_paths(self._data_dir)
+        if not paths:
             return []
 
+        # Parsing itself holds the GIL; the win is overlapping the blocking
+        # file reads across threads instead of serializing on filesystem
+        # latency.
         results: list[tuple[str, dict]] = []
-        for path in sorted(self._data_dir.glob("*/*_snapshot.json")):
-            try:
-                with open(path, encoding="utf-8") as f:
-                    snapshot = json.load(f)
+        with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+            for snapshot in executor.map(_load_snapshot, paths):
+                if snapshot is None:
+                    continue
                 ts = snapshot.get("timestamp", "")
                 if ts:
                     results.append((ts, snapshot))
-            except (json.JSONDecodeError, OSError) as exc:
-                logger.warning("Skipping malformed snapshot %s: %s", path, exc)
 
-        results.sort(key=lambda x: x[0])
+        # Snapshot filenames embed their timestamps, so glob order usually
+        # already matches: verify monotonicity in O(N) and skip the sort.
+        if any(a[0] > b[0] for a, b in zip(results, results[1:])):
+            results.sort(key=itemgetter(0))
+        return results
+
+    def _analyze_snapshots(self) -> list[tuple[str, dict, dict]]:
+        """Per-snapshot (ts, metrics, index_data) tuples, memoized on disk.
+
+        Analysis results are cached in data/cache/trends_history.pkl keyed by
+        schema version, path, and mtime, so unchanged snapshots are served
+        from the cache and only new or modified files are re-parsed and
+        re-analyzed.
+        """
+        paths = _snapshot_paths(self._data_dir)
+        if not paths:
+            return []
+
+        try:
+            with open(_HISTORY_CACHE_PATH, "rb") as f:
+                cache: dict[str, dict] = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            cache = {}
+
+        keys: list[str] = []
+        for path in paths:
+            try:
+                keys.append(f"{_HISTORY_CACHE_SCHEMA}:{path}:{path.stat().st_mtime_ns}")
+            except OSError:
+                keys.append("")
+
+        missing = [
+            (path, key)
+            for path, key in zip(paths, keys)
+            if key and key not in cache
+        ]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(32, len(missing))) as executor:
+                loaded = executor.map(_load_snapshot, [path for path, _ in missing])
+                for (path, key), snapshot in zip(missing, loaded):
+                    if snapshot is None:
+                        continue
+                    ts = snapshot.get("timestamp", "")
+                    if not ts:
+                        continue
+                    metrics = self._dist_analyzer.analyze_snapshot(snapshot)
+                    index_data = self._synth_index.compute(metrics)
+                    cache[key] = {"ts": ts, "metrics": metrics, "index_data": index_data}
+
+            # Drop entries for deleted/rewritten files, then rewrite atomically.
+            live = set(keys)
+            cache = {k: v for k, v in cache.items() if k in live}
+            try:
+                _HISTORY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                tmp = _HISTORY_CACHE_PATH.with_suffix(".pkl.tmp")
+                with open(tmp, "wb") as f:
+                    pickle.dump(cache, f, protocol=5)
+                tmp.replace(_HISTORY_CACHE_PATH)
+            except OSError as exc:
+                logger.warning("Could not write trends cache: %s", exc)
+
+        results = [
+            (entry["ts"], entry["metrics"], entry["index_data"])
+            for key in keys
+            if key and (entry := cache.get(key)) is not None
+        ]
+        if any(a[0] > b[0] for a, b in zip(results, results[1:])):
+            results.sort(key=itemgetter(0))
         return results
 
     def compute_history(self) -> dict:
         """Run DistributionAnalyzer and SynthIndex on every snapshot, build time series."""
-        snapshots = self.load_all_snapshots()
+        snapshots = self._analyze_snapshots()
         if not snapshots:
             return {
                 "period": {"start": None, "end": None, "snapshots": 0, "hours_covered": 0},
@@ -79,32 +281,37 @@ class TrendAnalyzer:
                 "distribution_history": {},
             }
 
-        synth_index_history: dict[str, list[dict]] = {}
-        distribution_history: dict[str, list[dict]] = {}
-
-        for ts, snapshot in snapshots:
-            metrics = self._dist_analyzer.analyze_snapshot(snapshot)
-            index_data = self._synth_index.compute(metrics)
+        # SoA layout: one list (finalized to a float64 array) per field and
+        # key, instead of one 9-field dict per timestamp. Downstream stats
+        # then run on contiguous arrays without any per-row unpacking.
+        synth_index_history: dict[str, dict] = {}
+        distribution_history: dict[str, dict] = {}
 
+        for ts, metrics, index_data in snapshots:
             for key, m in metrics.items():
-                distribution_history.setdefault(key, []).append({
-                    "timestamp": ts,
-                    "bias": m["directional_bias"],
-                    "width": m["forecast_width"],
-                    "skew": m["tail_asymmetry"],
-                    "tail_fatness": m["tail_fatness"],
-                    "upper_tail": m["upper_tail_risk"],
-                    "lower_tail": m["lower_tail_risk"],
-                    "density": m["density_concentration"],
-                    "regime": m["regime"],
+                cols = distribution_history.setdefault(key, {
+                    "timestamp": [],
+                    **{name: [] for name, _ in _DIST_COLUMNS},
+                    "regime": [],
                 })
+                cols["timestamp"].append(ts)
+                for name, metric_key in _DIST_COLUMNS:
+                    cols[name].append(m[metric_key])
+                cols["regime"].append(m["regime"])
 
             for key, idx in index_data.items():
-                synth_index_history.setdefault(key, []).append({
-                    "timestamp": ts,
-                    "value": idx["synth_index"],
-                    "level": idx["level"],
-                })
+                cols = synth_index_history.setdefault(
+                    key, {"timestamp": [], "value": [], "level": []}
+                )
+                cols["timestamp"].append(ts)
+                cols["value"].append(idx["synth_index"])
+                cols["level"].append(idx["level"])
+
+        for cols in distribution_history.values():
+            for name, _ in _DIST_COLUMNS:
+                cols[name] = np.asarray(cols[name], dtype=np.float64)
+        for cols in synth_index_history.values():
+            cols["value"] = np.asarray(cols["value"], dtype=np.float64)
 
         start_ts = snapshots[0][0]
         end_ts = snapshots[-1][0]
@@ -142,39 +349,36 @@ class TrendAnalyzer:
             summary: dict = {"asset": asset, "horizon": horizon}
 
             # Synth-Index stats
-            si_points = si_history.get(key, [])
-            if si_points:
-                values = [p["value"] for p in si_points]
-                current = values[-1]
-                mean_val = sum(values) / len(values)
-                rank = sum(1 for v in values if v <= current) / len(values) * 100
+            si_cols = si_history.get(key)
+            if si_cols and len(si_cols["timestamp"]):
+                values = si_cols["value"]
+                current = float(values[-1])
+                rank = np.count_nonzero(values <= current) / values.size * 100
+                std_val = float(values.std(ddof=1)) if values.size > 1 else 0.0
 
                 summary["synth_index"] = {
-                    "mean": round(mean_val, 1),
-                    "min": round(min(values), 1),
-                    "max": round(max(values), 1),
-                    "std": round(
-                        (sum((v - mean_val) ** 2 for v in values) / max(len(values) - 1, 1)) ** 0.5,
-                        1,
-                    ),
+                    "mean": round(float(values.mean()), 1),
+                    "min": round(float(values.min()), 1),
+                    "max": round(float(values.max()), 1),
+                    "std": round(std_val, 1),
                     "current": round(current, 1),
                     "percentile_rank": round(rank),
                 }
 
             # Distribution stats
-            dist_points = dist_history.get(key, [])
-            if dist_points:
-                bias_vals = [p["bias"] for p in dist_points]
-                width_vals = [p["width"] for p in dist_points]
-                skew_vals = [p["skew"] for p in dist_points]
-                regimes = [p["regime"] for p in dist_points]
+            dist_cols = dist_history.get(key)
+            if dist_cols and dist_cols["timestamp"]:
+                n_points = len(dist_cols["timestamp"])
+                bias_vals = dist_cols["bias"]
+                width_vals = dist_cols["width"]
+                skew_vals = dist_cols["skew"]
+                # Counter's C-level counting replaces the old per-element
+                # dict-get tally; keep the key-sorted breakdown order.
+                regime_counts = Counter(dist_cols["regime"])
 
                 # Trend detection on last 12 points
-                recent_bias = bias_vals[-12:]
-                recent_width = width_vals[-12:]
-
-                bias_slope = _linear_slope(recent_bias)
-                width_slope = _linear_slope(recent_width)
+                bias_slope = _linear_slope(bias_vals[-12:])
+                width_slope = _linear_slope(width_vals[-12:])
 
                 # Thresholds for trend classification
                 bias_threshold = 0.0001
@@ -195,36 +399,28 @@ class TrendAnalyzer:
                     width_trend = "STABLE"
 
                 # Count skew flips (crossing 1.0)
-                skew_flips = 0
-                for i in range(1, len(skew_vals)):
-                    if (skew_vals[i - 1] < 1.0 and skew_vals[i] >= 1.0) or \
-                       (skew_vals[i - 1] >= 1.0 and skew_vals[i] < 1.0):
-                        skew_flips += 1
+                skew_flips = int(_count_flips(skew_vals))
 
                 # Regime breakdown
-                total_regimes = len(regimes)
-                regime_counts: dict[str, int] = {}
-                for r in regimes:
-                    regime_counts[r] = regime_counts.get(r, 0) + 1
                 regime_breakdown = {
-                    r: f"{count / total_regimes:.0%}"
+                    r: f"{count / n_points:.0%}"
                     for r, count in sorted(regime_counts.items())
                 }
 
                 summary["bias"] = {
-                    "mean": round(sum(bias_vals) / len(bias_vals), 6),
-                    "min": round(min(bias_vals), 6),
-                    "max": round(max(bias_vals), 6),
+                    "mean": round(float(bias_vals.mean()), 6),
+                    "min": round(float(bias_vals.min()), 6),
+                    "max": round(float(bias_vals.max()), 6),
                     "trend": bias_trend,
                 }
                 summary["width"] = {
-                    "mean": round(sum(width_vals) / len(width_vals), 6),
-                    "min": round(min(width_vals), 6),
-                    "max": round(max(width_vals), 6),
+                    "mean": round(float(width_vals.mean()), 6),
+                    "min": round(float(width_vals.min()), 6),
+                    "max": round(float(width_vals.max()), 6),
                     "trend": width_trend,
                 }
                 summary["skew"] = {
-                    "mean": round(sum(skew_vals) / len(skew_vals), 4),
+                    "mean": round(float(skew_vals.mean()), 4),
                     "flips": skew_flips,
                 }
                 summary["regime_breakdown"] = regime_breakdown
@@ -240,9 +436,8 @@ class TrendAnalyzer:
             return {"insufficient_data": True, "resolved": 0}
 
         try:
-            with open(resolved_path, encoding="utf-8") as f:
-                resolved = json.load(f)
-        except (json.JSONDecodeError, OSError):
+            resolved = orjson.loads(resolved_path.read_bytes())
+        except (orjson.JSONDecodeError, OSError):
             return {"insufficient_data": True, "resolved": 0}
 
         if len(resolved) < 5:
@@ -252,104 +447,111 @@ class TrendAnalyzer:
         resolved.sort(key=lambda e: e.get("resolved_at", ""))
 
         total = len(resolved)
-        correct = sum(1 for e in resolved if e.get("resolution") == "CORRECT")
-        pnls = [e.get("pnl", 0.0) for e in resolved]
-        total_pnl = sum(pnls)
+
+        # One pass over the edge dicts fills every column the aggregations
+        # below need; nothing re-walks the list-of-dicts afterwards.
+        pnls = np.empty(total, dtype=np.float64)
+        flags = np.empty(total, dtype=np.int32)
+        resolved_ats = [""] * total
+        assets = [""] * total
+        etypes = [""] * total
+        confs = [""] * total
+        for i, e in enumerate(resolved):
+            pnls[i] = e.get("pnl", 0.0)
+            flags[i] = 1 if e.get("resolution") == "CORRECT" else 0
+            resolved_ats[i] = e.get("resolved_at", "")
+            assets[i] = e.get("asset", "unknown")
+            etypes[i] = e.get("edge_type", "unknown")
+            confs[i] = e.get("confidence", "unknown")
+
+        correct = int(flags.sum())
+        total_pnl = float(pnls.sum())
         mean_pnl = total_pnl / total
 
         # Sharpe ratio
         if total > 1:
-            std_pnl = (sum((p - mean_pnl) ** 2 for p in pnls) / (total - 1)) ** 0.5
+            std_pnl = float(pnls.std(ddof=1))
             sharpe = (mean_pnl / std_pnl * math.sqrt(365 * 24)) if std_pnl > 0 else 0.0
         else:
             sharpe = 0.0
 
-        # Rolling hit rate (window of 10)
-        rolling_hit_rate: list[dict] = []
+        # Rolling hit rate (window of 10), computed as one sliding-window
+        # convolution over the correctness flags instead of re-counting each
+        # window from scratch.
         window = 10
-        for i in range(window - 1, total):
-            chunk = resolved[i - window + 1: i + 1]
-            hits = sum(1 for e in chunk if e.get("resolution") == "CORRECT")
-            rolling_hit_rate.append({
-                "timestamp": chunk[-1].get("resolved_at", ""),
+        csum = np.concatenate(([0], flags.cumsum()))
+        window_hits = csum[window:] - csum[:-window]
+        rolling_hit_rate: list[dict] = [
+            {
+                "timestamp": resolved_ats[i + window - 1],
                 "hit_rate_last_10": round(hits / window, 4),
-            })
-
-        # Cumulative PnL
-        cumulative_pnl: list[dict] = []
-        running = 0.0
-        for e in resolved:
-            running += e.get("pnl", 0.0)
-            cumulative_pnl.append({
-                "timestamp": e.get("resolved_at", ""),
-                "cumulative": round(running, 4),
-            })
-
-        # Best/worst 10-edge windows
-        best_hr = 0.0
-        worst_hr = 1.0
+            }
+            for i, hits in enumerate(window_hits.tolist())
+        ]
+
+        # Cumulative PnL as one prefix sum
+        running = pnls.cumsum()
+        cumulative_pnl: list[dict] = [
+            {
+                "timestamp": ts,
+                "cumulative": round(cum, 4),
+            }
+            for ts, cum in zip(resolved_ats, running.tolist())
+        ]
+
+        # Best/worst 10-edge windows from the same window_hits array. The
+        # reversed argmax/argmin keeps the old tie-breaking (latest window
+        # wins on equal hit rate).
         best_window: dict = {}
         worst_window: dict = {}
-        for i in range(window - 1, total):
-            chunk = resolved[i - window + 1: i + 1]
-            hits = sum(1 for e in chunk if e.get("resolution") == "CORRECT")
-            hr = hits / window
-            if hr >= best_hr:
-                best_hr = hr
-                best_window = {
-                    "start": chunk[0].get("resolved_at", ""),
-                    "end": chunk[-1].get("resolved_at", ""),
-                    "hit_rate": round(hr, 4),
-                }
-            if hr <= worst_hr:
-                worst_hr = hr
-                worst_window = {
-                    "start": chunk[0].get("resolved_at", ""),
-                    "end": chunk[-1].get("resolved_at", ""),
-                    "hit_rate": round(hr, 4),
+        if window_hits.size:
+            n_windows = window_hits.shape[0]
+
+            def _window_summary(idx: int) -> dict:
+                return {
+                    "start": resolved_ats[idx],
+                    "end": resolved_ats[idx + window - 1],
+                    "hit_rate": round(float(window_hits[idx]) / window, 4),
                 }
 
-        # By asset
-        by_asset: dict[str, dict] = {}
-        for e in resolved:
-            a = e.get("asset", "unknown")
-            by_asset.setdefault(a, {"correct": 0, "total": 0, "pnl": 0.0})
-            by_asset[a]["total"] += 1
-            by_asset[a]["pnl"] += e.get("pnl", 0.0)
-            if e.get("resolution") == "CORRECT":
-                by_asset[a]["correct"] += 1
-        for a, s in by_asset.items():
-            s["hit_rate"] = round(s["correct"] / s["total"], 4) if s["total"] else 0.0
-            s["pnl"] = round(s["pnl"], 4)
-            s["n"] = s["total"]
-
-        # By edge type
-        by_edge_type: dict[str, dict] = {}
-        for e in resolved:
-            et = e.get("edge_type", "unknown")
-            by_edge_type.setdefault(et, {"correct": 0, "total": 0, "pnl": 0.0})
-            by_edge_type[et]["total"] += 1
-            by_edge_type[et]["pnl"] += e.get("pnl", 0.0)
-            if e.get("resolution") == "CORRECT":
-                by_edge_type[et]["correct"] += 1
-        for et, s in by_edge_type.items():
-            s["hit_rate"] = round(s["correct"] / s["total"], 4) if s["total"] else 0.0
-            s["pnl"] = round(s["pnl"], 4)
-            s["n"] = s["total"]
-
-        # By confidence
-        by_confidence: dict[str, dict] = {}
-        for e in resolved:
-            c = e.get("confidence", "unknown")
-            by_confidence.setdefault(c, {"correct": 0, "total": 0, "pnl": 0.0})
-            by_confidence[c]["total"] += 1
-            by_confidence[c]["pnl"] += e.get("pnl", 0.0)
-            if e.get("resolution") == "CORRECT":
-                by_confidence[c]["correct"] += 1
-        for c, s in by_confidence.items():
-            s["hit_rate"] = round(s["correct"] / s["total"], 4) if s["total"] else 0.0
-            s["pnl"] = round(s["pnl"], 4)
-            s["n"] = s["total"]
+            best_window = _window_summary(
+                n_windows - 1 - int(np.argmax(window_hits[::-1]))
+            )
+            worst_window = _window_summary(
+                n_windows - 1 - int(np.argmin(window_hits[::-1]))
+            )
+
+        # By asset / edge type / confidence: one DataFrame, three
+        # vectorized group-bys instead of three dict-accumulator loops.
+        df = pd.DataFrame(
+            {
+                "asset": assets,
+                "edge_type": etypes,
+                "confidence": confs,
+                "is_correct": flags,
+                "pnl": pnls,
+            }
+        )
+        breakdowns: dict[str, dict[str, dict]] = {}
+        for dim in ("asset", "edge_type", "confidence"):
+            grouped = df.groupby(dim, sort=False).agg(
+                correct=("is_correct", "sum"),
+                total=("is_correct", "size"),
+                pnl=("pnl", "sum"),
+            )
+            breakdowns[dim] = {
+                group: {
+                    "correct": int(n_correct),
+                    "total": int(n_total),
+                    "pnl": round(float(pnl_sum), 4),
+                    "hit_rate": round(n_correct / n_total, 4) if n_total else 0.0,
+                    "n": int(n_total),
+                }
+                for group, n_correct, n_total, pnl_sum in grouped.itertuples(name=None)
+            }
+        by_asset = breakdowns["asset"]
+        by_edge_type = breakdowns["edge_type"]
+        by_confidence = breakdowns["confidence"]
 
         return {
             "insufficient_data": False,
@@ -375,14 +577,28 @@ class TrendAnalyzer:
             "period": history["period"],
             "asset_summaries": summary,
             "edge_performance": edge_perf,
-            "synth_index_history": history["synth_index_history"],
+            "synth_index_history": {
+                key: _si_rows(series)
+                for key, series in history["synth_index_history"].items()
+            },
         }
 
     def export_for_frontend(self, output_path: str = "data/exports/trends.json") -> Path:
-        """Export trend data as a single JSON file the frontend can consume."""
+        """Export trend data as JSON the frontend can consume.
+
+        The synth_index_history series grows linearly with snapshot count, so
+        it is written to a sibling trends_history.json and referenced by
+        filename from the main report, keeping the main document small.
+        """
         report = self.generate_report()
         out = Path(output_path)
         out.parent.mkdir(parents=True, exist_ok=True)
-        with open(out, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, default=str)
+
+        opts = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        history = report.pop("synth_index_history", {})
+        history_out = out.with_name(f"{out.stem}_history{out.suffix}")
+        history_out.write_bytes(orjson.dumps(history, default=str, option=opts))
+        report["synth_index_history_file"] = history_out.name
+
+        out.write_bytes(orjson.dumps(report, default=str, option=opts))
         return out
@@ -5,59 +5,83 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from rich.console import Console
-from rich.table import Table
-
 from backend.synth_client import SynthClient, SynthAPIError
 
-console = Console()
+# rich pulls in pygments/markdown-it at import time (~100-300 ms); skip it
+# entirely when output is piped (CI, cron health checks) and print plainly.
+USE_RICH = sys.stdout.isatty()
+
+if USE_RICH:
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
 
 
 def main() -> None:
     client = SynthClient()
 
-    console.print("\n[bold]Prism — Synth API Verification[/bold]\n")
+    if USE_RICH:
+        console.print("\n[bold]Prism — Synth API Verification[/bold]\n")
+    else:
+        print("\nPrism — Synth API Verification\n")
 
     try:
         data = client.get_prediction_percentiles("BTC", "24h")
     except SynthAPIError as e:
-        console.print(f"[red]API Error: {e}[/red]")
+        _error(f"API Error: {e}")
         sys.exit(1)
     except Exception as e:
-        console.print(f"[red]Connection Error: {e}[/red]")
+        _error(f"Connection Error: {e}")
         sys.exit(1)
 
     current_price = data.get("current_price")
     forecast_future = data.get("forecast_future", {})
     percentiles = forecast_future.get("percentiles", [])
 
-    table = Table(title="BTC 24h Prediction Percentiles")
-    table.add_column("Field", style="cyan")
-    table.add_column("Value", style="green")
-
-    table.add_row("Asset", "BTC")
-    table.add_row("Horizon", "24h")
+    rows: list[tuple[str, str]] = [
+        ("Asset", "BTC"),
+        ("Horizon", "24h"),
+    ]
 
     if current_price is not None:
-        table.add_row("Current Price", f"${current_price:,.2f}")
+        rows.append(("Current Price", f"${current_price:,.2f}"))
 
-    table.add_row("Forecast Timepoints", str(len(percentiles)))
+    rows.append(("Forecast Timepoints", str(len(percentiles))))
 
     if percentiles:
         first = percentiles[0]
         last = percentiles[-1]
         levels = sorted(first.keys())
-        table.add_row("Percentile Levels", ", ".join(levels))
+        rows.append(("Percentile Levels", ", ".join(levels)))
 
         p50_start = first.get("0.5")
         p50_end = last.get("0.5")
         if p50_start is not None:
-            table.add_row("Median (start)", f"${p50_start:,.2f}")
+            rows.append(("Median (start)", f"${p50_start:,.2f}"))
         if p50_end is not None:
-            table.add_row("Median (end)", f"${p50_end:,.2f}")
-
-    console.print(table)
-    console.print("\n[green]API connection verified.[/green]\n")
+            rows.append(("Median (end)", f"${p50_end:,.2f}"))
+
+    if USE_RICH:
+        table = Table(title="BTC 24h Prediction Percentiles")
+        table.add_column("Field", style="cyan")
+        table.add_column("Value", style="green")
+        for label, value in rows:
+            table.add_row(label, value)
+        console.print(table)
+        console.print("\n[green]API connection verified.[/green]\n")
+    else:
+        print("BTC 24h Prediction Percentiles")
+        for label, value in rows:
+            print(f"{label:20}: {value}")
+        print("\nAPI connection verified.\n")
+
+
+def _error(message: str) -> None:
+    if USE_RICH:
+        console.print(f"[red]{message}[/red]")
+    else:
+        print(message, file=sys.stderr)
 
 
 if __name__ == "__main__":
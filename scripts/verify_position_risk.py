@@ -10,6 +10,8 @@ import json
 from typing import Any
 from unittest.mock import MagicMock
 
+import numpy as np
+
 from backend.analysis.position_risk import PositionRiskAnalyzer
 from backend.analysis.probability import ProbabilityEngine
 
@@ -34,6 +36,9 @@ _OFFSETS_SHAPE: dict[str, float] = {
     "0.995":  1.077,
 }
 
+_PERCENTILE_KEYS = list(_OFFSETS_SHAPE)
+_SHAPE_ARR = np.asarray(list(_OFFSETS_SHAPE.values()), dtype=np.float64)
+
 
 def _make_response(asset: str, horizon: str) -> dict[str, Any]:
     """Build a synthetic Synth API response for the given asset."""
@@ -42,15 +47,11 @@ def _make_response(asset: str, horizon: str) -> dict[str, Any]:
     max_spread = cfg["spread"]
 
     n = 289
-    total_sec = 3600 if horizon == "1h" else 86400
-    timepoints = []
-
-    for i in range(n):
-        factor = i / (n - 1)  # 0 at start, 1 at end
-        tp = {}
-        for key, shape in _OFFSETS_SHAPE.items():
-            tp[key] = base * (1.0 + shape * max_spread * factor)
-        timepoints.append(tp)
+    # One (n, 9) broadcast instead of ~2600 scalar multiplies: spreads widen
+    # linearly from 0 at the first timepoint to max_spread at the last.
+    factors = np.linspace(0.0, 1.0, n)
+    table = base * (1.0 + _SHAPE_ARR * max_spread * factors[:, None])
+    timepoints = [dict(zip(_PERCENTILE_KEYS, row)) for row in table.tolist()]
 
     return {"current_price": base, "forecast_future": {"percentiles": timepoints}}
 
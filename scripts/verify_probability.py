@@ -11,6 +11,8 @@ import sys
 from typing import Any
 from unittest.mock import MagicMock
 
+import numpy as np
+
 from backend.analysis.probability import ProbabilityEngine, PERCENTILE_LEVELS
 
 
@@ -18,29 +20,35 @@ from backend.analysis.probability import ProbabilityEngine, PERCENTILE_LEVELS
 
 _CURRENT_PRICE = 88500.0
 
+# Offsets as % of current price at maximum horizon.
+_OFFSETS: dict[str, float] = {
+    "0.005": -0.065,
+    "0.05":  -0.042,
+    "0.2":   -0.020,
+    "0.35":  -0.010,
+    "0.5":    0.001,
+    "0.65":   0.012,
+    "0.8":    0.023,
+    "0.95":   0.045,
+    "0.995":  0.070,
+}
+
+_KEYS = tuple(_OFFSETS)
+_OFFS = np.asarray(list(_OFFSETS.values()), dtype=np.float64)
+
+
 def _make_timepoint(seconds_ahead: int, spread_factor: float) -> dict[str, Any]:
     """Generate a realistic percentile spread that widens over time."""
-    # Offsets as % of current price at maximum horizon.
-    offsets = {
-        "0.005": -0.065,
-        "0.05":  -0.042,
-        "0.2":   -0.020,
-        "0.35":  -0.010,
-        "0.5":    0.001,
-        "0.65":   0.012,
-        "0.8":    0.023,
-        "0.95":   0.045,
-        "0.995":  0.070,
-    }
-    return {k: _CURRENT_PRICE * (1.0 + v * spread_factor) for k, v in offsets.items()}
+    prices = _CURRENT_PRICE * (1.0 + _OFFS * spread_factor)
+    return dict(zip(_KEYS, prices.tolist()))
 
 
 def _build_synthetic_response() -> dict[str, Any]:
     """Build a response matching the Synth API structure for 289 timepoints."""
-    timepoints = []
-    for i in range(289):
-        spread = i / 288  # 0.0 at start → 1.0 at end
-        timepoints.append(_make_timepoint(round(86400 * i / 288), spread))
+    # Spread widens linearly 0 → 1; one outer product builds the whole grid.
+    spread = np.arange(289) / 288
+    grid = _CURRENT_PRICE * (1.0 + np.multiply.outer(spread, _OFFS))
+    timepoints = [dict(zip(_KEYS, row)) for row in grid.tolist()]
     return {
         "current_price": _CURRENT_PRICE,
         "forecast_future": {"percentiles": timepoints},
@@ -73,13 +81,12 @@ def _build_engine_live() -> ProbabilityEngine | None:
 
 # ── Test functions ────────────────────────────────────────────────────
 
-def test_data_fetch(engine: ProbabilityEngine, label: str) -> dict[str, Any]:
-    """Fetch percentile data and print summary."""
+def test_data_fetch(label: str, data: dict[str, Any]) -> None:
+    """Print a summary of already-fetched percentile data."""
     print(f"\n{'='*60}")
     print(f"  {label}: Percentile Data (BTC 24h)")
     print(f"{'='*60}")
 
-    data = engine.get_percentile_data("BTC", "24h")
     print(f"  Asset:         {data['asset']}")
     print(f"  Horizon:       {data['horizon']}")
     print(f"  Current price: ${data['current_price']:,.2f}")
@@ -92,12 +99,9 @@ def test_data_fetch(engine: ProbabilityEngine, label: str) -> dict[str, Any]:
         pct_move = (price / data["current_price"] - 1) * 100
         print(f"    P{level*100:5.1f}: ${price:>12,.2f}  ({pct_move:+.2f}%)")
 
-    return data
-
 
-def test_probabilities(engine: ProbabilityEngine, label: str) -> None:
+def test_probabilities(engine: ProbabilityEngine, label: str, data: dict[str, Any]) -> None:
     """Test probability_above, probability_below, probability_between."""
-    data = engine.get_percentile_data("BTC", "24h")
     cp = data["current_price"]
 
     print(f"\n{'='*60}")
@@ -154,22 +158,20 @@ def test_cone(engine: ProbabilityEngine, label: str) -> None:
               f"spread={pt['p95']-pt['p05']:>8,.2f}")
 
 
-def test_monotonicity(engine: ProbabilityEngine, label: str) -> None:
+def test_monotonicity(engine: ProbabilityEngine, label: str, data: dict[str, Any]) -> None:
     """Verify interpolation is monotonic: higher price → higher CDF."""
     print(f"\n{'='*60}")
     print(f"  {label}: Monotonicity Check")
     print(f"{'='*60}")
 
-    data = engine.get_percentile_data("BTC", "24h")
     cp = data["current_price"]
 
     prices = [cp * (0.90 + i * 0.02) for i in range(11)]  # 90% to 110%
+    cdfs = engine.probability_below_batch("BTC", prices)
     prev_cdf = -1.0
     all_ok = True
 
-    for p in prices:
-        res = engine.probability_below("BTC", p)
-        cdf = res["probability"]
+    for p, cdf in zip(prices, cdfs):
         status = "OK" if cdf >= prev_cdf else "FAIL"
         if cdf < prev_cdf:
             all_ok = False
@@ -200,10 +202,12 @@ def main() -> None:
     engines.append(("SYNTHETIC", _build_engine_with_synthetic()))
 
     for label, engine in engines:
-        test_data_fetch(engine, label)
-        test_probabilities(engine, label)
+        # Fetch once per engine and thread the data through the tests.
+        data = engine.get_percentile_data("BTC", "24h")
+        test_data_fetch(label, data)
+        test_probabilities(engine, label, data)
         test_cone(engine, label)
-        test_monotonicity(engine, label)
+        test_monotonicity(engine, label, data)
 
     print(f"\n{'='*60}")
     print("  Verification complete.")